@@ -2,7 +2,8 @@
 Advanced analytics for sports betting: Market edge, EV calculation, matchup grades, and tactical filters.
 """
 import math
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
 
 def calculate_expected_value(probability: float, odds: int, bet_amount: float = 100) -> Dict:
     """
@@ -539,11 +540,12 @@ def filter_positive_ev(edges: List[Dict]) -> List[Dict]:
     """Filter to only positive EV edges."""
     return [e for e in edges if e.get('is_positive_ev', False)]
 
+GRADE_ORDER = {'A+': 4.3, 'A': 4.0, 'A-': 3.7, 'B+': 3.3, 'B': 3.0, 'B-': 2.7,
+               'C+': 2.3, 'C': 2.0, 'C-': 1.7, 'D+': 1.3, 'D': 1.0, 'F': 0.0}
+
 def filter_by_grade(edges: List[Dict], min_grade: str = 'B') -> List[Dict]:
     """Filter edges by minimum grade."""
-    grade_order = {'A+': 4.3, 'A': 4.0, 'A-': 3.7, 'B+': 3.3, 'B': 3.0, 'B-': 2.7,
-                   'C+': 2.3, 'C': 2.0, 'C-': 1.7, 'D+': 1.3, 'D': 1.0, 'F': 0.0}
-    min_grade_num = grade_order.get(min_grade, 0.0)
+    min_grade_num = GRADE_ORDER.get(min_grade, 0.0)
     return [e for e in edges if e.get('matchup_grade', {}).get('grade_numeric', 0) >= min_grade_num]
 
 def filter_by_probability(edges: List[Dict], min_probability: float = 70.0) -> List[Dict]:
@@ -554,9 +556,61 @@ def filter_by_market_edge(edges: List[Dict], min_edge: float = 5.0) -> List[Dict
     """Filter edges by minimum market edge."""
     return [e for e in edges if e.get('market_edge', 0) >= min_edge]
 
+@lru_cache(maxsize=32)
+def _compile_tactical_filter(filter_items: tuple) -> Callable[[Dict], bool]:
+    """Build the predicate for one filter set from its active checks only."""
+    filters = dict(filter_items)
+    checks = []
+    
+    if filters.get('min_probability'):
+        min_probability = filters['min_probability']
+        checks.append(lambda e: e.get('probability', 0) >= min_probability)
+    
+    if filters.get('min_grade'):
+        min_grade_num = GRADE_ORDER.get(filters['min_grade'], 0.0)
+        checks.append(lambda e: e.get('matchup_grade', {}).get('grade_numeric', 0) >= min_grade_num)
+    
+    if filters.get('min_market_edge'):
+        min_market_edge = filters['min_market_edge']
+        checks.append(lambda e: e.get('market_edge', 0) >= min_market_edge)
+    
+    if filters.get('positive_ev_only'):
+        checks.append(lambda e: e.get('is_positive_ev', False))
+    
+    if filters.get('exclude_injuries'):
+        checks.append(lambda e: not e.get('factors', {}).get('injury_risk', False))
+    
+    if filters.get('exclude_rotation_changes'):
+        checks.append(lambda e: not e.get('factors', {}).get('rotation_change', False))
+    
+    if filters.get('min_ev'):
+        min_ev = filters['min_ev']
+        checks.append(lambda e: e.get('ev', {}).get('ev', 0) >= min_ev)
+    
+    if not checks:
+        return lambda e: True
+    if len(checks) == 1:
+        return checks[0]
+    
+    def predicate(edge: Dict) -> bool:
+        for check in checks:
+            if not check(edge):
+                return False
+        return True
+    return predicate
+
+def compile_tactical_filter(filters: Dict) -> Callable[[Dict], bool]:
+    """
+    Build a predicate that checks an edge against the active tactical filters.
+    
+    Inactive filters are dropped up front, so the predicate only runs the
+    checks this filter set needs. Predicates are cached per filter set.
+    """
+    return _compile_tactical_filter(tuple(sorted(filters.items())))
+
 def apply_tactical_filters(edges: List[Dict], filters: Dict) -> List[Dict]:
     """
-    Apply multiple tactical filters to edges.
+    Apply multiple tactical filters to edges in a single pass.
     
     Args:
         edges: List of edge dictionaries
@@ -572,30 +626,8 @@ def apply_tactical_filters(edges: List[Dict], filters: Dict) -> List[Dict]:
     Returns:
         Filtered list of edges
     """
-    filtered = edges.copy()
-    
-    if filters.get('min_probability'):
-        filtered = filter_by_probability(filtered, filters['min_probability'])
-    
-    if filters.get('min_grade'):
-        filtered = filter_by_grade(filtered, filters['min_grade'])
-    
-    if filters.get('min_market_edge'):
-        filtered = filter_by_market_edge(filtered, filters['min_market_edge'])
-    
-    if filters.get('positive_ev_only'):
-        filtered = filter_positive_ev(filtered)
-    
-    if filters.get('exclude_injuries'):
-        filtered = [e for e in filtered if not e.get('factors', {}).get('injury_risk', False)]
-    
-    if filters.get('exclude_rotation_changes'):
-        filtered = [e for e in filtered if not e.get('factors', {}).get('rotation_change', False)]
-    
-    if filters.get('min_ev'):
-        filtered = [e for e in filtered if e.get('ev', {}).get('ev', 0) >= filters['min_ev']]
-    
-    return filtered
+    predicate = compile_tactical_filter(filters)
+    return [e for e in edges if predicate(e)]
 
 def get_sort_options() -> List[Dict]:
     """Get available sort options."""
@@ -1,32 +1,68 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, jsonify, request, g, has_request_context
 from datetime import datetime, time, timedelta
 import json
 import os
 import atexit
+import queue
+import gc
+import random
 import sys
+import tempfile
+import hashlib
+import importlib.util
+import inspect
+import operator
+import threading
+import time as time_module
+import uuid
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from werkzeug.exceptions import HTTPException
+from urllib.parse import parse_qsl
+
+# Per-request progress lines (projection reloads, players checked) are only
+# printed with APP_VERBOSE_LOGS=1 - warnings and errors are always printed
+VERBOSE_LOGS = os.environ.get('APP_VERBOSE_LOGS', '0') == '1'
 
 # Import core modules with error handling to prevent startup failures
+# nba_engine itself is imported on first use (see _nba) to keep worker boot
+# and /health fast, but its hard dependencies are imported here so a missing
+# one still stops startup instead of failing every edges request
 try:
-    from nba_engine import check_for_edges, get_all_active_players, generate_projections_from_active_players
+    import pandas
+    import requests
+    import nba_api.stats.endpoints
 except ImportError as e:
-    print(f"CRITICAL: Failed to import nba_engine: {e}", file=sys.stderr)
+    print(f"CRITICAL: Failed to import nba_engine dependency ({e.name or 'unknown'}): {e}", file=sys.stderr)
+    sys.exit(1)
+if importlib.util.find_spec('nba_engine') is None:
+    print("CRITICAL: Failed to import nba_engine: module not found", file=sys.stderr)
     sys.exit(1)
+_nba_engine = None
 
+def _nba():
+    """Return the nba_engine module, importing it on first use."""
+    global _nba_engine
+    if _nba_engine is None:
+        import nba_engine as _nba_engine
+    return _nba_engine
+
+# The app can't serve pages without these - fail fast with one check
 try:
     from line_tracker import (
         track_line_changes, get_line_changes, add_to_chase_list, get_chase_list,
-        remove_from_chase_list, add_alt_line, get_alt_lines, update_line
+        remove_from_chase_list, add_alt_line, get_alt_lines, update_line,
+        CHASE_LIST_FILE, ALT_LINES_FILE
     )
-except ImportError as e:
-    print(f"CRITICAL: Failed to import line_tracker: {e}", file=sys.stderr)
-    sys.exit(1)
-
-try:
     from glitched_props import (
-        add_glitched_prop, get_glitched_props, remove_glitched_prop, update_glitched_prop
+        add_glitched_prop, get_glitched_props, remove_glitched_prop, update_glitched_prop,
+        GLITCHED_PROPS_FILE
     )
+    from auth import requires_auth
 except ImportError as e:
-    print(f"CRITICAL: Failed to import glitched_props: {e}", file=sys.stderr)
+    print(f"CRITICAL: Failed to import core module ({e.name or 'unknown'}): {e}", file=sys.stderr)
     sys.exit(1)
 
 try:
@@ -50,21 +86,16 @@ except ImportError as e:
     def get_bets_by_date(date_str): return []
 
 try:
-    from glitched_props_scanner import scan_active_players_for_glitches, get_scan_status
+    from glitched_props_scanner import scan_active_players_for_glitches, get_scan_status, RECENT_SCANS_FILE
 except ImportError as e:
     print(f"WARNING: Failed to import glitched_props_scanner: {e}", file=sys.stderr)
+    RECENT_SCANS_FILE = 'recent_glitched_scans.json'
     # Make stub functions to prevent errors
-    def scan_active_players_for_glitches():
+    def scan_active_players_for_glitches(quick_scan=False, max_players=None, max_workers=None):
         return []
     def get_scan_status():
         return {'status': 'disabled', 'error': 'Module not available'}
 
-try:
-    from auth import requires_auth
-except ImportError as e:
-    print(f"CRITICAL: Failed to import auth: {e}", file=sys.stderr)
-    sys.exit(1)
-
 try:
     from cache_manager import clear_old_cache
 except ImportError as e:
@@ -92,11 +123,11 @@ except ImportError as e:
     print(f"WARNING: Failed to import advanced_analytics: {e}", file=sys.stderr)
     def enhance_edge_with_analytics(*args, **kwargs):
         return {}
-    def sort_edges_by_ev(edges):
+    def sort_edges_by_ev(edges, reverse=True):
         return edges
-    def sort_edges_by_market_edge(edges):
+    def sort_edges_by_market_edge(edges, reverse=True):
         return edges
-    def sort_edges_by_grade(edges):
+    def sort_edges_by_grade(edges, reverse=True):
         return edges
     def apply_tactical_filters(edges, filters):
         return edges
@@ -123,34 +154,66 @@ except ImportError as e:
     def is_valid_stat_type(stat):
         return True
 
-# Try to import scheduler, but don't fail if it's not available
-try:
-    from apscheduler.schedulers.background import BackgroundScheduler
-    SCHEDULER_AVAILABLE = True
-except ImportError:
-    SCHEDULER_AVAILABLE = False
-    print("Warning: APScheduler not available. Scheduled updates disabled.")
+# Set APP_ENABLE_SCHEDULER=0 on the web service when worker.py runs the jobs
+# in a sibling process - the web process then only re-reads projections.json.
+SCHEDULER_ENABLED = os.environ.get('APP_ENABLE_SCHEDULER', '1') != '0'
+
+# Try to import scheduler, but don't fail if it's not available. Only
+# processes that run it pay for the import.
+SCHEDULER_AVAILABLE = False
+if SCHEDULER_ENABLED:
+    try:
+        from apscheduler.schedulers.background import BackgroundScheduler
+        SCHEDULER_AVAILABLE = True
+    except ImportError:
+        print("Warning: APScheduler not available. Scheduled updates disabled.")
 
 app = Flask(__name__)
 
+# Request handlers queue error reports for a logger thread instead of writing
+# tracebacks to stderr themselves, so an error storm doesn't serialize every
+# request on stderr. Bounded - when it is full, new reports are dropped.
+ERROR_LOG_QUEUE_MAX = 1024
+_error_log = queue.Queue(maxsize=ERROR_LOG_QUEUE_MAX)
+
+def _error_log_writer():
+    """Background thread: write queued error reports to stderr."""
+    while True:
+        report = _error_log.get()
+        try:
+            print(report, file=sys.stderr)
+        except Exception:
+            pass
+
+def log_error(message, with_traceback=True):
+    """Queue message (plus the current traceback) for stderr."""
+    if with_traceback:
+        import traceback
+        message = f"{message}\n{traceback.format_exc().rstrip()}"
+    try:
+        _error_log.put_nowait(message)
+    except queue.Full:
+        pass
+
+threading.Thread(target=_error_log_writer, name='error-log', daemon=True).start()
+
 # Global exception handler to prevent worker crashes
 @app.errorhandler(Exception)
 def handle_exception(e):
     """Catch all unhandled exceptions to prevent worker crashes."""
+    # 404s, 405s etc. are normal responses, not crashes - no traceback needed
+    if isinstance(e, HTTPException):
+        return e
+    
     import traceback
     error_trace = traceback.format_exc()
     error_type = type(e).__name__
     error_msg = str(e)
     
-    # Log to stderr for Gunicorn to capture
-    print("=" * 80, file=sys.stderr)
-    print(f"UNHANDLED EXCEPTION: {error_type}: {error_msg}", file=sys.stderr)
-    print("=" * 80, file=sys.stderr)
-    print(error_trace, file=sys.stderr)
-    print("=" * 80, file=sys.stderr)
-    
-    # Also print to stdout
-    print(f"UNHANDLED EXCEPTION: {error_type}: {error_msg}")
+    # Log to stderr for Gunicorn to capture, as one write
+    separator = "=" * 80
+    log_error(f"{separator}\nUNHANDLED EXCEPTION: {error_type}: {error_msg}\n{separator}\n"
+              f"{error_trace}{separator}", with_traceback=False)
     
     # Return a safe error response instead of crashing
     return jsonify({
@@ -167,8 +230,199 @@ try:
 except ImportError:
     print("Flask-Compress not available, compression disabled (optional)")
 
+# Serialize jsonify() responses with orjson when available (optional)
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider that encodes with orjson, falling back to json."""
+        # datetimes/dataclasses go through Flask's default() so output matches json
+        OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY |
+                   orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+        def _encode(self, obj, option, **kwargs):
+            if kwargs.get('sort_keys', self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            if kwargs.get('indent'):
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option)
+
+        def dumps(self, obj, **kwargs):
+            try:
+                return self._encode(obj, self.OPTIONS, **kwargs).decode()
+            except TypeError:
+                # e.g. ints over 64 bits - let the stdlib handle it
+                return super().dumps(obj, **kwargs)
+
+        def response(self, *args, **kwargs):
+            # Hand orjson's bytes straight to the response instead of
+            # decoding to str and letting Werkzeug encode them again
+            obj = self._prepare_response_obj(args, kwargs)
+            indent = (self.compact is None and self._app.debug) or self.compact is False
+            try:
+                body = self._encode(obj, self.OPTIONS | orjson.OPT_APPEND_NEWLINE, indent=indent)
+            except TypeError:
+                return super().response(*args, **kwargs)
+            return self._app.response_class(body, mimetype=self.mimetype)
+
+        def loads(self, s, **kwargs):
+            if kwargs:
+                return super().loads(s, **kwargs)
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+    ORJSON_AVAILABLE = True
+    print("orjson JSON provider enabled")
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("orjson not available, using standard json (optional)")
+
+# Response timestamp string, rebuilt at most once per second
+_TS = {'epoch': 0, 's': ''}
+
+def _iso_now(sep='T'):
+    """datetime.now().isoformat(sep) at one-second resolution, cached per second."""
+    epoch = int(time_module.time())
+    cached = _TS['s']
+    if epoch != _TS['epoch'] or not cached:
+        cached = datetime.fromtimestamp(epoch).isoformat()
+        _TS['s'] = cached
+        _TS['epoch'] = epoch
+    return cached if sep == 'T' else cached.replace('T', sep, 1)
+
+def _json_constant(payload):
+    """Encode a response payload once so the bytes can be re-sent as-is."""
+    return (app.json.dumps(payload, separators=(',', ':')) + '\n').encode('utf-8')
+
+def _constant_response(body, status=200):
+    """Build a response around a body from _json_constant."""
+    return app.response_class(body, status=status, mimetype='application/json')
+
+# Responses whose content never changes - encoded once instead of per request
+_HEALTH_BODY = _json_constant({'status': 'ok', 'message': 'App is running'})
+_SCHEDULER_OFF_BODY = _json_constant({
+    'scheduler_running': False,
+    'daily_update_scheduled': False,
+    'next_run': None,
+    'last_update': None,
+    'note': 'Scheduler not initialized or not available'
+})
+_PARLAY_DISABLED_BODY = _json_constant({
+    'success': True,
+    'recommendations': {
+        '2_man': [],
+        '3_man': [],
+        '4_man': [],
+        '5_man': [],
+        '6_man': []
+    },
+    'available_edges': 0,
+    'message': 'Parlay calculator disabled on free tier to prevent crashes. Upgrade to enable.'
+})
+
 # File to store projections
 PROJECTIONS_FILE = 'projections.json'
+PROJECTIONS_PATH = os.path.abspath(PROJECTIONS_FILE)  # For log messages
+
+# Parsed projections.json, keyed on the file's (path, mtime_ns, size)
+_PROJECTIONS_FILE_CACHE = {'entry': (None, None)}
+
+# Short-lived cache of projections for read-only GET endpoints, so polling
+# doesn't re-read and re-parse projections.json on every request.
+# save_projections resets 'ts' to force the next read to hit the file.
+PROJ_CACHE_TTL = 30  # seconds
+_PROJ_CACHE = {'data': None, 'ts': 0.0}
+
+# Guards MARKET_PROJECTIONS rebinds and mutate+save sequences. Every rebind
+# happens under it; request handlers read the dict into a local via
+# _projections() and never rebind the global. Readers only hold it long
+# enough to grab a reference, never while serializing.
+_PROJ_LOCK = threading.RLock()
+
+# Bumped (under _PROJ_LOCK) whenever MARKET_PROJECTIONS gets new content, so
+# anything derived from the projections can be keyed on it without hashing
+# the whole dict
+_proj_version = 0
+
+def _bump_projections_version():
+    global _proj_version
+    _proj_version += 1
+
+# Write-behind for projections: request handlers mark the in-memory dict
+# dirty and a background thread writes it after a short debounce, so bursts
+# of updates become one file write.
+PROJ_FLUSH_DELAY = 2.0  # seconds
+PROJ_FLUSH_MAX_DELAY = 300.0  # seconds - retry interval cap while writes keep failing
+_dirty = threading.Event()
+_writer_lock = threading.Lock()
+_flush_lock = threading.Lock()  # One flush at a time, so writes land in order
+_writer_thread = None
+
+# Last encoded GET /api/projections body: (summary key, body bytes, ETag),
+# swapped as one tuple so concurrent readers never mix entries
+_PROJ_SUMMARY = {'entry': (None, None, None)}
+
+# Last /api/line-changes diff: ((projections version, date), changes),
+# swapped as one tuple so concurrent readers never pair a key with another diff
+_LINE_CHANGES_CACHE = {'entry': (None, None)}
+
+# Shared read-only stand-in for edges without factors (avoids a new {} per edge)
+_EMPTY_FACTORS = MappingProxyType({})
+
+# Shared pool for background loads - bounds how many run at once and
+# reuses threads instead of spawning one per trigger
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='bgload')
+_INFLIGHT = {}  # key -> Future of the load running for that key
+_INFLIGHT_LOCK = threading.Lock()
+
+def _submit_once(key, fn, *args):
+    """
+    Submit fn to the background pool unless a job with the same key is
+    still running. Returns the Future, or None for a duplicate.
+    """
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        if future is not None and not future.done():
+            return None
+        future = _EXECUTOR.submit(fn, *args)
+        _INFLIGHT[key] = future
+        return future
+
+# Background player load state (shared by all request threads)
+LOAD_STUCK_SECONDS = 1200  # Longer than a full manual load (10-15 min) - probably hung
+_load_lock = threading.Lock()
+_load_event = threading.Event()  # Set while a background load is running
+_load_started_at = 0.0  # time.monotonic() when the current load started
+_load_started_wall = None  # time.time() of the same moment, for the status API
+
+def _try_begin_load():
+    """
+    Atomically claim the background load slot.
+    
+    Returns True if the caller should start a load, False if one is
+    already running. A load older than LOAD_STUCK_SECONDS is treated as
+    crashed and replaced.
+    """
+    global _load_started_at, _load_started_wall
+    with _load_lock:
+        if _load_event.is_set():
+            elapsed = time_module.monotonic() - _load_started_at
+            if elapsed <= LOAD_STUCK_SECONDS:
+                print(f"Player loading already in progress (started {int(elapsed / 60)} min ago), skipping duplicate trigger...")
+                print(f"   If stuck, restart the app or wait for completion.")
+                return False
+            print(f"WARNING: Previous load thread appears stuck ({LOAD_STUCK_SECONDS // 60}+ min), resetting flag...")
+        _load_event.set()
+        _load_started_at = time_module.monotonic()
+        _load_started_wall = time_module.time()
+        return True
+
+def _load_elapsed_seconds():
+    """Seconds since the running background load started, or None if idle."""
+    if not _load_event.is_set():
+        return None
+    return int(time_module.monotonic() - _load_started_at)
 
 # No default projections - app will only show loaded players
 DEFAULT_PROJECTIONS = {}
@@ -189,32 +443,48 @@ def ensure_default_projections(projections):
     return projections.copy() if projections else {}
 
 def load_projections():
-    """Load projections from file or return empty dict."""
-    file_path = os.path.abspath(PROJECTIONS_FILE)
-    if os.path.exists(PROJECTIONS_FILE):
-        try:
-            file_size = os.path.getsize(PROJECTIONS_FILE)
-            print(f"Found projections file: {file_path} ({file_size} bytes)")
-            with open(PROJECTIONS_FILE, 'r') as f:
-                projections = json.load(f)
-                # Return loaded projections (no defaults added)
-                if projections:
-                    print(f"Loaded {len(projections)} players from {PROJECTIONS_FILE}")
-                    return projections
-                else:
-                    print(f"WARNING: Projections file exists but is empty")
-                    return {}
-        except json.JSONDecodeError as e:
-            print(f"ERROR: Invalid JSON in projections file: {e}")
-            return {}
-        except Exception as e:
-            print(f"ERROR: Error loading projections from {file_path}: {e}")
-            import traceback
-            traceback.print_exc()
-            return {}
-    else:
+    """
+    Load projections from file or return empty dict.
+    The parsed dict is cached against the file's mtime and size, so repeat
+    loads of an unchanged file skip the read and parse.
+    """
+    file_path = PROJECTIONS_PATH
+    try:
+        st = os.stat(PROJECTIONS_FILE)
+    except FileNotFoundError:
         print(f"INFO: Projections file not found: {file_path}")
-    return {}
+        return {}
+    except OSError as e:
+        print(f"ERROR: Error loading projections from {file_path}: {e}")
+        return {}
+    
+    file_key = (PROJECTIONS_FILE, st.st_mtime_ns, st.st_size)
+    cached_key, cached_projections = _PROJECTIONS_FILE_CACHE['entry']
+    if cached_key == file_key:
+        return cached_projections
+    
+    try:
+        print(f"Found projections file: {file_path} ({st.st_size} bytes)")
+        with open(PROJECTIONS_FILE, 'rb') as f:
+            raw = f.read()
+        projections = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        # Return loaded projections (no defaults added)
+        if projections:
+            print(f"Loaded {len(projections)} players from {PROJECTIONS_FILE}")
+            _PROJECTIONS_FILE_CACHE['entry'] = (file_key, projections)
+            return projections
+        else:
+            print(f"WARNING: Projections file exists but is empty")
+            return {}
+    except ValueError as e:
+        # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
+        print(f"ERROR: Invalid JSON in projections file: {e}")
+        return {}
+    except Exception as e:
+        print(f"ERROR: Error loading projections from {file_path}: {e}")
+        import traceback
+        traceback.print_exc()
+        return {}
 
 def save_projections(projections):
     """Save projections to file."""
@@ -225,22 +495,44 @@ def save_projections(projections):
         
         # No longer adding default players - save what we have
         
-        file_path = os.path.abspath(PROJECTIONS_FILE)
-        print(f"Saving {len(projections)} players to: {file_path}")
-        
-        with open(PROJECTIONS_FILE, 'w') as f:
-            json.dump(projections, f, indent=2)
+        print(f"Saving {len(projections)} players to: {PROJECTIONS_PATH}")
         
-        # Verify it was saved
-        if os.path.exists(PROJECTIONS_FILE):
-            file_size = os.path.getsize(PROJECTIONS_FILE)
-            print(f"SUCCESS: Successfully saved {len(projections)} players to {PROJECTIONS_FILE}")
-            print(f"   File size: {file_size} bytes")
-            print(f"   Sample players saved: {', '.join(list(projections.keys())[:5])}...")
-            return True
+        # Encode compactly up front (orjson releases the GIL while encoding)
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(projections, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
         else:
-            print(f"ERROR: File was not created at {file_path}")
-            return False
+            payload = json.dumps(projections, separators=(',', ':')).encode('utf-8')
+        file_size = len(payload)
+        
+        # Write to a temp file and swap it in so readers in other processes
+        # (worker.py / the web workers) never see a half-written file
+        tmp_path = PROJECTIONS_FILE + '.tmp'
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, PROJECTIONS_FILE)
+        finally:
+            # Gone after a successful replace - otherwise don't leave a
+            # partial temp file behind
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+        _PROJ_CACHE['ts'] = 0.0
+        # What we just wrote is the file's content - next load is a cache hit
+        st = os.stat(PROJECTIONS_FILE)
+        _PROJECTIONS_FILE_CACHE['entry'] = ((PROJECTIONS_FILE, st.st_mtime_ns, st.st_size), projections)
+        
+        print(f"SUCCESS: Successfully saved {len(projections)} players to {PROJECTIONS_FILE}")
+        print(f"   File size: {file_size} bytes")
+        print(f"   Sample players saved: {', '.join(islice(projections, 5))}...")
+        return True
     except PermissionError as e:
         print(f"ERROR: Permission denied saving to {PROJECTIONS_FILE}: {e}")
         return False
@@ -274,109 +566,265 @@ except Exception as e:
 def get_market_projections(force_reload=False):
     """Get current projections, reloading if requested."""
     global MARKET_PROJECTIONS
-    if force_reload:
+    if force_reload and _dirty.is_set():
+        # Unsaved in-memory changes are newer than the file
+        if VERBOSE_LOGS:
+            print(f"Pending write - keeping {len(MARKET_PROJECTIONS)} players in memory")
+    elif force_reload:
+        # Read the file outside the lock - only the rebind needs it
         file_projections = load_projections()
-        # Only overwrite if file has data OR memory is empty
-        # This prevents losing in-memory data when file doesn't persist (ephemeral filesystem)
-        if file_projections and len(file_projections) > 0:
-            MARKET_PROJECTIONS = file_projections
-            print(f"Reloaded {len(MARKET_PROJECTIONS)} players from projections file")
-        elif len(MARKET_PROJECTIONS) > 0:
-            print(f"File empty but keeping {len(MARKET_PROJECTIONS)} players in memory")
-        else:
-            print("No players in file or memory")
-    return MARKET_PROJECTIONS
+        with _PROJ_LOCK:
+            # Only overwrite if file has data OR memory is empty
+            # This prevents losing in-memory data when file doesn't persist (ephemeral filesystem)
+            # (re-check dirty: an update may have landed while the file was read)
+            if file_projections and len(file_projections) > 0 and not _dirty.is_set():
+                if file_projections is not MARKET_PROJECTIONS:
+                    # Usually our own last save coming back - same content
+                    if file_projections != MARKET_PROJECTIONS:
+                        _bump_projections_version()
+                    MARKET_PROJECTIONS = file_projections
+                if VERBOSE_LOGS:
+                    print(f"Reloaded {len(MARKET_PROJECTIONS)} players from projections file")
+            elif len(MARKET_PROJECTIONS) > 0:
+                if VERBOSE_LOGS:
+                    print(f"File empty but keeping {len(MARKET_PROJECTIONS)} players in memory")
+            else:
+                print("No players in file or memory")
+            return MARKET_PROJECTIONS
+    with _PROJ_LOCK:
+        return MARKET_PROJECTIONS
+
+def _projections():
+    """
+    get_market_projections(force_reload=True), at most once per request.
+    index() and /api/edges both reload and then call get_edges_data, which
+    reloads again - the second call reuses the first. Outside a request
+    (scheduled jobs) every call reloads.
+    """
+    if not has_request_context():
+        return get_market_projections(force_reload=True)
+    if 'projections' not in g:
+        # Version first: a write landing in between pairs newer data with
+        # the older version (a wasted cache entry), never the reverse
+        g.projections_version = _proj_version
+        g.projections = get_market_projections(force_reload=True)
+    return g.projections
+
+def _projections_version():
+    """
+    _proj_version as of the request's _projections() call - the data it
+    returned is at least that new. Outside a request, the current version.
+    """
+    if has_request_context() and 'projections_version' in g:
+        return g.projections_version
+    return _proj_version
+
+def flush_projections_sync():
+    """Write MARKET_PROJECTIONS to disk now if it has unsaved changes.
+
+    Used at exit and by the scheduled update so neither has to wait for the
+    debounced background writer.
+    """
+    with _flush_lock:
+        # Snapshot under the lock, write outside it so requests don't wait
+        # on the fsync
+        with _PROJ_LOCK:
+            if not _dirty.is_set():
+                return False
+            _dirty.clear()
+            snapshot = dict(MARKET_PROJECTIONS)
+        saved = False
+        try:
+            saved = save_projections(snapshot)
+        finally:
+            # Keep the changes queued for the next flush if this one failed
+            if not saved and snapshot:
+                _dirty.set()
+        return saved
+
+def _projection_writer():
+    """
+    Background thread: flush dirty projections after PROJ_FLUSH_DELAY.
+    While writes keep failing, the delay doubles up to PROJ_FLUSH_MAX_DELAY
+    and the failure is reported once.
+    """
+    delay = PROJ_FLUSH_DELAY
+    while True:
+        _dirty.wait()
+        time_module.sleep(delay)
+        error = None
+        try:
+            saved = flush_projections_sync()
+        except Exception as e:
+            saved = False
+            error = e
+        if saved or not _dirty.is_set():
+            if delay > PROJ_FLUSH_DELAY:
+                print("Background projections write succeeded again")
+            delay = PROJ_FLUSH_DELAY
+            continue
+        if delay == PROJ_FLUSH_DELAY:
+            detail = f": {error}" if error else ""
+            print(f"ERROR: Background projections write failed{detail} - "
+                  f"retrying with backoff (up to {PROJ_FLUSH_MAX_DELAY:.0f}s)", file=sys.stderr)
+        delay = min(delay * 2, PROJ_FLUSH_MAX_DELAY)
+
+def _mark_projections_dirty():
+    """Schedule MARKET_PROJECTIONS to be written by the background writer."""
+    global _writer_thread
+    with _PROJ_LOCK:
+        _bump_projections_version()
+    _PROJ_CACHE['ts'] = 0.0
+    clear_edges_cache()
+    _dirty.set()
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_projection_writer, daemon=True)
+            _writer_thread.start()
+
+# Don't lose a pending write on shutdown
+atexit.register(flush_projections_sync)
+
+def _cached_projections(ttl=PROJ_CACHE_TTL):
+    """Get projections, reloading from file at most once every ttl seconds."""
+    now = time_module.monotonic()
+    if _PROJ_CACHE['data'] is not None and now - _PROJ_CACHE['ts'] < ttl:
+        return _PROJ_CACHE['data']
+    projections = get_market_projections(force_reload=True)
+    _PROJ_CACHE['data'] = projections
+    _PROJ_CACHE['ts'] = now
+    return projections
 
 # Initialize scheduler for daily updates (only start if not already running)
 scheduler = None
 
+def daily_update_job():
+    """Run daily update at 8am - load all active players and refresh edges."""
+    global MARKET_PROJECTIONS
+    print(f"[{datetime.now()}] Running daily update at 8am...")
+    
+    try:
+        # Clear old cache before updating
+        print("Clearing expired cache...")
+        clear_old_cache()
+        
+        # Auto-load all active players and generate projections
+        print("Loading all active NBA players...")
+        new_projections = _nba().generate_projections_from_active_players(stat_type='PTS', season='2023-24')
+        
+        # Track line changes before updating
+        old_projections = load_projections()
+        changes = track_line_changes(new_projections)
+        if changes:
+            print(f"Line changes detected: {len(changes)} players")
+            for player, change in changes.items():
+                print(f"  {player}: {change['previous']} → {change['current']} ({change['direction']})")
+        
+        # Save new projections
+        with _PROJ_LOCK:
+            MARKET_PROJECTIONS = new_projections
+            _mark_projections_dirty()
+        flush_projections_sync()
+        
+        # Pre-populate the edges cache for the default view (70%+ PTS), so
+        # the first page view / poll after the update is served from memory.
+        # Only when the job runs in the web process - worker.py's cache is
+        # never read by anyone.
+        if SCHEDULER_ENABLED:
+            get_edges_data(new_projections)
+        
+        print(f"Daily update complete! Loaded {len(MARKET_PROJECTIONS)} active players.")
+    except Exception as e:
+        print(f"ERROR: Exception in daily_update_job: {e}", file=sys.stderr)
+        import traceback
+        error_trace = traceback.format_exc()
+        print(error_trace, file=sys.stderr)
+        print(f"ERROR: Exception in daily_update_job: {e}")
+        traceback.print_exc()
+
+def glitched_props_scan_job():
+    """Run glitched props scan every 5 minutes (24/7) in background."""
+    try:
+        print(f"[{datetime.now()}] Running automated background glitched props scan...")
+        found_glitches = scan_active_players_for_glitches(quick_scan=False)  # Full scan in background
+        if found_glitches:
+            print(f"Found {len(found_glitches)} new glitched props")
+        else:
+            print("No new glitched props found this scan")
+    except Exception as e:
+        print(f"ERROR: Exception in glitched_props_scan_job: {e}", file=sys.stderr)
+        import traceback
+        error_trace = traceback.format_exc()
+        print(error_trace, file=sys.stderr)
+        print(f"ERROR: Exception in glitched_props_scan_job: {e}")
+        traceback.print_exc()
+
+def register_scheduled_jobs(target_scheduler):
+    """Add the daily update and glitched props scan jobs to a scheduler."""
+    # Schedule daily update at 8am
+    target_scheduler.add_job(
+        func=daily_update_job,
+        trigger="cron",
+        hour=8,
+        minute=0,
+        id='daily_update',
+        name='Daily 8am Update',
+        replace_existing=True
+    )
+    
+    # Schedule glitched props scan every 5 minutes (24/7) in background
+    target_scheduler.add_job(
+        func=glitched_props_scan_job,
+        trigger="interval",
+        minutes=5,
+        id='glitched_props_scan',
+        name='Glitched Props Scan (24/7 Background)',
+        replace_existing=True
+    )
+
+# Only one process per host runs the in-process scheduler. Each gunicorn
+# worker imports the app, and without the lock every worker would fire the
+# 8am update.
+SCHEDULER_LOCK_FILE = os.environ.get(
+    'APP_SCHEDULER_LOCK', os.path.join(tempfile.gettempdir(), 'nba_edge_scheduler.lock'))
+_scheduler_lock = None  # Held open for the life of the process
+
+def acquire_scheduler_lock(path):
+    """
+    Take an exclusive non-blocking lock on path.
+    Returns the open file holding the lock, None if another process holds
+    it, or True where file locks aren't supported (Windows).
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return True
+    lock_file = open(path, 'w')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
 def init_scheduler():
     """Initialize and start the scheduler."""
-    global scheduler
+    global scheduler, _scheduler_lock
     if not SCHEDULER_AVAILABLE:
         print("Scheduler not available - skipping initialization")
         return
     
     try:
+        if _scheduler_lock is None:
+            _scheduler_lock = acquire_scheduler_lock(SCHEDULER_LOCK_FILE)
+            if _scheduler_lock is None:
+                print(f"INFO: Scheduler already running in another process ({SCHEDULER_LOCK_FILE}) - skipping")
+                return
         if scheduler is None or (hasattr(scheduler, 'running') and not scheduler.running):
             scheduler = BackgroundScheduler(daemon=True)
             scheduler.start()
             
-            def daily_update_job():
-                """Run daily update at 8am - load all active players and refresh edges."""
-                global MARKET_PROJECTIONS
-                print(f"[{datetime.now()}] Running daily update at 8am...")
-                
-                try:
-                    # Clear old cache before updating
-                    print("Clearing expired cache...")
-                    clear_old_cache()
-                    
-                    # Auto-load all active players and generate projections
-                    print("Loading all active NBA players...")
-                    new_projections = generate_projections_from_active_players(stat_type='PTS', season='2023-24')
-                    
-                    # Track line changes before updating
-                    old_projections = load_projections()
-                    changes = track_line_changes(new_projections)
-                    if changes:
-                        print(f"Line changes detected: {len(changes)} players")
-                        for player, change in changes.items():
-                            print(f"  {player}: {change['previous']} → {change['current']} ({change['direction']})")
-                    
-                    # Save new projections
-                    MARKET_PROJECTIONS = new_projections
-                    save_projections(MARKET_PROJECTIONS)
-                    
-                    # Refresh edges data (pre-cache for faster access)
-                    get_edges_data()
-                    
-                    print(f"Daily update complete! Loaded {len(MARKET_PROJECTIONS)} active players.")
-                except Exception as e:
-                    print(f"ERROR: Exception in daily_update_job: {e}", file=sys.stderr)
-                    import traceback
-                    error_trace = traceback.format_exc()
-                    print(error_trace, file=sys.stderr)
-                    print(f"ERROR: Exception in daily_update_job: {e}")
-                    traceback.print_exc()
-            
-            def glitched_props_scan_job():
-                """Run glitched props scan every 5 minutes (24/7) in background."""
-                try:
-                    print(f"[{datetime.now()}] Running automated background glitched props scan...")
-                    found_glitches = scan_active_players_for_glitches(quick_scan=False)  # Full scan in background
-                    if found_glitches:
-                        print(f"Found {len(found_glitches)} new glitched props")
-                    else:
-                        print("No new glitched props found this scan")
-                except Exception as e:
-                    print(f"ERROR: Exception in glitched_props_scan_job: {e}", file=sys.stderr)
-                    import traceback
-                    error_trace = traceback.format_exc()
-                    print(error_trace, file=sys.stderr)
-                    print(f"ERROR: Exception in glitched_props_scan_job: {e}")
-                    traceback.print_exc()
-            
-            # Schedule daily update at 8am
-            scheduler.add_job(
-                func=daily_update_job,
-                trigger="cron",
-                hour=8,
-                minute=0,
-                id='daily_update',
-                name='Daily 8am Update',
-                replace_existing=True
-            )
-            
-            # Schedule glitched props scan every 5 minutes (24/7) in background
-            scheduler.add_job(
-                func=glitched_props_scan_job,
-                trigger="interval",
-                minutes=5,
-                id='glitched_props_scan',
-                name='Glitched Props Scan (24/7 Background)',
-                replace_existing=True
-            )
+            register_scheduled_jobs(scheduler)
             
             # Shut down scheduler on app exit
             atexit.register(lambda: scheduler.shutdown() if scheduler and hasattr(scheduler, 'shutdown') else None)
@@ -387,7 +835,82 @@ def init_scheduler():
         print(f"Warning: Could not initialize scheduler: {e}")
         print("Daily updates will not run automatically, but app will still work")
 
-def get_edges_data(show_only_70_plus=True, stat_type='PTS', 
+# Recent get_edges_data results: key -> (expires_at, result, tag). A burst of
+# page views / polls with the same inputs shares one edge computation; the
+# random tag identifies the entry (across workers too) for /api/edges ETags.
+EDGES_CACHE_TTL = 30  # seconds
+EDGES_CACHE_MAX = 8
+_EDGES_CACHE = {}
+_EDGES_CACHE_LOCK = threading.Lock()
+
+def clear_edges_cache():
+    """Drop all cached edge results (projections changed)."""
+    with _EDGES_CACHE_LOCK:
+        _EDGES_CACHE.clear()
+
+def get_edges_data(projections=None, **filters):
+    """
+    Cached front for _compute_edges_data, which takes the same arguments.
+    Results are reused for EDGES_CACHE_TTL seconds per projections version +
+    filters combination; error results are never cached. projections must
+    be the current ones (from _projections() or just installed).
+    """
+    return _get_edges_entry(projections, **filters)[0]
+
+def _get_edges_entry(projections=None, **filters):
+    """get_edges_data() plus its cache entry's tag (None if not cached)."""
+    if projections is None:
+        projections = _projections()
+    # Fill in defaults so get_edges_data(p) and get_edges_data(p, stat_type='PTS')
+    # share an entry
+    key = (_projections_version(),
+           tuple(sorted({**_EDGES_DEFAULT_FILTERS, **filters}.items())))
+    now = time_module.monotonic()
+    with _EDGES_CACHE_LOCK:
+        entry = _EDGES_CACHE.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1], entry[2]
+    
+    result = _compute_edges_data(projections, **filters)
+    if result[4] is not None:
+        return result, None
+    tag = uuid.uuid4().hex
+    with _EDGES_CACHE_LOCK:
+        if len(_EDGES_CACHE) >= EDGES_CACHE_MAX:
+            # Drop expired entries, or the oldest one if none have expired
+            expired = [k for k, (expires_at, _, _) in _EDGES_CACHE.items() if expires_at <= now]
+            for k in expired or [next(iter(_EDGES_CACHE))]:
+                del _EDGES_CACHE[k]
+        _EDGES_CACHE[key] = (now + EDGES_CACHE_TTL, result, tag)
+    return result, tag
+
+def _sort_edges_by(key):
+    """Build a sort_edges_by_* style sorter from a key function."""
+    def sort_edges(edges, reverse=True):
+        return sorted(edges, key=key, reverse=reverse)
+    return sort_edges
+
+# sort_by option -> sorter, all called as sorter(edges, reverse=True).
+# Every processed edge has its probability set, so no .get() default needed.
+_EDGE_SORTS = {
+    'ev': sort_edges_by_ev,
+    'market_edge': sort_edges_by_market_edge,
+    'probability': _sort_edges_by(operator.itemgetter('probability')),
+    'grade': sort_edges_by_grade,
+    'edge': _sort_edges_by(lambda x: abs(x.get('difference', 0))),
+    'kelly': _sort_edges_by(lambda x: x.get('analytics', {}).get('kelly_fraction', 0)),
+}
+
+# check_for_edges runs on its own pool so it can be bounded by a timeout from
+# any request thread, without queueing behind background player loads
+EDGES_TIMEOUT = 300  # seconds - must stay under the gunicorn timeout
+_EDGES_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='edges')
+
+# Expired API cache files are swept from the edges path on a timer
+CACHE_CLEAR_INTERVAL = 300  # seconds
+_CACHE_CLEAR = {'last': 0.0}  # time.monotonic() of the last sweep
+
+def _compute_edges_data(projections=None, show_only_70_plus=True, stat_type='PTS', 
                    sort_by='ev', min_probability=70.0, min_ev=0.0, min_market_edge=0.0,
                    min_grade=None, positive_ev_only=False, exclude_injuries=False, exclude_rotation=False):
     """
@@ -396,6 +919,7 @@ def get_edges_data(show_only_70_plus=True, stat_type='PTS',
     Uses caching to improve performance.
     
     Args:
+        projections: Projections the caller already loaded (default: reload)
         show_only_70_plus: Filter to 70%+ probability props
         stat_type: Stat category to analyze (default: 'PTS')
         sort_by: Sort method ('ev', 'market_edge', 'probability', 'grade', 'edge', 'kelly')
@@ -408,96 +932,91 @@ def get_edges_data(show_only_70_plus=True, stat_type='PTS',
         exclude_rotation: Exclude players with rotation changes
     """
     try:
-        import gc
-        # Aggressive memory cleanup at start of request
-        gc.collect()
-        
-        # Clear old cache periodically (every 5 calls for better memory)
-        import random
-        if random.randint(1, 5) == 1:
+        # Clear old cache periodically (at most every CACHE_CLEAR_INTERVAL seconds)
+        # and collect garbage along with it - refcounting frees the rest
+        now = time_module.monotonic()
+        if now - _CACHE_CLEAR['last'] > CACHE_CLEAR_INTERVAL:
+            _CACHE_CLEAR['last'] = now
             clear_old_cache()
             gc.collect()
         
-        from nba_engine import filter_high_probability_props, calculate_hit_probability
-        
-        # Track line changes before checking edges
-        # Reload projections in case they were updated in background
-        global MARKET_PROJECTIONS
-        MARKET_PROJECTIONS = get_market_projections(force_reload=True)
+        # Reload projections in case they were updated in background,
+        # unless the caller already has them. Only read - never rebind the
+        # shared MARKET_PROJECTIONS from a request.
+        if projections is None:
+            projections = _projections()
         
         # Use fallback players if no projections loaded
-        if not MARKET_PROJECTIONS or len(MARKET_PROJECTIONS) == 0:
-            print("INFO: Using fallback players - background load in progress")
-            MARKET_PROJECTIONS = FALLBACK_PLAYERS.copy()
+        if not projections:
+            if VERBOSE_LOGS:
+                print("INFO: Using fallback players - background load in progress")
+            projections = FALLBACK_PLAYERS
         
         # Note: Don't generate projections here - it blocks the request
         # Use the "Load All Active Players" button or wait for background load
         # For different stat types, we'll use the same projections but check edges for that stat
-        
-        track_line_changes(MARKET_PROJECTIONS)
+        # Line changes are tracked by the daily/manual update and /api/line-changes, not per page view
         
         # FREE TIER MODE: 6 players to balance variety with memory limits
         # Frontend handles pagination - shuffled for variety on each refresh
         max_players = 6
-        if len(MARKET_PROJECTIONS) > max_players:
-            # Shuffle to get different players each time for variety
-            import random
-            all_items = list(MARKET_PROJECTIONS.items())
-            random.shuffle(all_items)
-            projections_to_check = dict(all_items[:max_players])
-            print(f"INFO: Processing {max_players} of {len(MARKET_PROJECTIONS)} players (shuffled for variety)")
+        if len(projections) > max_players:
+            # Random pick to get different players each time for variety -
+            # sample() draws k names without shuffling every (name, line) pair
+            picked = random.sample(list(projections), max_players)
+            projections_to_check = {name: projections[name] for name in picked}
+            if VERBOSE_LOGS:
+                print(f"INFO: Processing {max_players} of {len(projections)} players (shuffled for variety)")
         else:
-            projections_to_check = MARKET_PROJECTIONS
+            projections_to_check = projections
         
+        # A timed-out or failed calculation is reported as an error so the
+        # empty result is neither cached nor ETagged
+        calc_error = None
         try:
             # Disable expensive operations to prevent timeout
             # include_factors=False reduces API calls significantly
             # include_streaks=False skips streak calculations
-            # Use a timeout wrapper to prevent hanging
-            import signal
-            
-            def timeout_handler(signum, frame):
-                raise TimeoutError("Edge calculation timed out")
-            
-            # Set a 5-minute timeout for edge calculation
-            # This ensures we don't exceed the 10-minute gunicorn timeout
-            try:
-                # For Unix systems, use signal
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(300)  # 5 minutes
-            except (AttributeError, OSError):
-                # Windows doesn't support SIGALRM, skip timeout
-                pass
-            
-            try:
-                result = check_for_edges(projections_to_check, threshold=2.0, stat_type=stat_type, include_streaks=False, min_streak=2, include_factors=False)
-                all_edges = result.get('edges', []) if result else []
-                streaks = result.get('streaks', []) if result else []
-            finally:
-                try:
-                    signal.alarm(0)  # Cancel timeout
-                except (AttributeError, OSError):
-                    pass
-        except TimeoutError as e:
-            print(f"WARNING: Edge calculation timed out after 5 minutes: {e}")
+            # Run on the edges pool with a 5-minute timeout so we don't exceed
+            # the gunicorn timeout. Unlike SIGALRM this works from any thread.
+            future = _EDGES_EXECUTOR.submit(
+                _nba().check_for_edges, projections_to_check, threshold=2.0, stat_type=stat_type,
+                include_streaks=False, min_streak=2, include_factors=False
+            )
+            result = future.result(timeout=EDGES_TIMEOUT)
+            all_edges = result.get('edges', []) if result else []
+            streaks = result.get('streaks', []) if result else []
+        except FuturesTimeout:
+            # The calculation can't be interrupted - it finishes in the background
+            print(f"WARNING: Edge calculation timed out after {EDGES_TIMEOUT} seconds")
             all_edges = []
             streaks = []
+            calc_error = f"Edge calculation timed out after {EDGES_TIMEOUT} seconds - try again shortly"
         except Exception as e:
             print(f"Error in check_for_edges: {e}")
             import traceback
             traceback.print_exc()
             all_edges = []
             streaks = []
+            calc_error = f"Error calculating edges: {str(e)}"
+        
+        # Filter to 70%+ if requested (but respect min_probability if higher)
+        effective_min_probability = max(70.0, min_probability) if show_only_70_plus else min_probability
         
         # Calculate probability and enhance with analytics for each edge
         # Limit to first 20 edges to prevent timeout
         edges = []
         edges_to_process = all_edges[:20] if len(all_edges) > 20 else all_edges
+        calculate_hit_probability = _nba().calculate_hit_probability
         for edge in edges_to_process:
             try:
-                factors = edge.get('factors', {})
-                streak_info = edge.get('streak', {}) if edge.get('streak', {}).get('active') else None
+                factors = edge.get('factors') or _EMPTY_FACTORS
+                streak = edge.get('streak')
+                streak_info = streak if streak and streak.get('active') else None
                 probability = calculate_hit_probability(edge, factors, streak_info)
+                # Drop edges below the cut before paying for the analytics
+                if probability < effective_min_probability:
+                    continue
                 edge['probability'] = probability
                 
                 # Enhance with advanced analytics (EV, grades, etc.)
@@ -513,10 +1032,9 @@ def get_edges_data(show_only_70_plus=True, stat_type='PTS',
                 # Skip this edge and continue
                 continue
         
-        # Apply tactical filters
+        # Apply tactical filters (the probability cut was already applied above)
         try:
             filter_dict = {
-                'min_probability': min_probability,
                 'min_ev': min_ev,
                 'min_market_edge': min_market_edge,
                 'min_grade': min_grade,
@@ -529,39 +1047,19 @@ def get_edges_data(show_only_70_plus=True, stat_type='PTS',
             print(f"Error applying tactical filters: {e}")
             import traceback
             traceback.print_exc()
-            # Fallback to unfiltered edges if filtering fails
+            # Fallback to the probability cut alone if filtering fails
             filtered_edges = edges
         
-        # Filter to 70%+ if requested (but respect min_probability if higher)
-        if show_only_70_plus:
-            min_prob = max(70.0, min_probability)
-            filtered_edges = [e for e in filtered_edges if e.get('probability', 0) >= min_prob]
-        else:
-            filtered_edges = [e for e in filtered_edges if e.get('probability', 0) >= min_probability]
-        
-        # Apply sorting
-        if sort_by == 'ev':
-            filtered_edges = sort_edges_by_ev(filtered_edges, reverse=True)
-        elif sort_by == 'market_edge':
-            filtered_edges = sort_edges_by_market_edge(filtered_edges, reverse=True)
-        elif sort_by == 'probability':
-            filtered_edges.sort(key=lambda x: x.get('probability', 0), reverse=True)
-        elif sort_by == 'grade':
-            filtered_edges = sort_edges_by_grade(filtered_edges, reverse=True)
-        elif sort_by == 'edge':
-            filtered_edges.sort(key=lambda x: abs(x.get('difference', 0)), reverse=True)
-        elif sort_by == 'kelly':
-            filtered_edges.sort(key=lambda x: x.get('analytics', {}).get('kelly_fraction', 0), reverse=True)
-        else:
-            # Default sort by EV
-            filtered_edges = sort_edges_by_ev(filtered_edges, reverse=True)
+        # Apply sorting (unknown sort_by values fall back to EV)
+        filtered_edges = _EDGE_SORTS.get(sort_by, sort_edges_by_ev)(filtered_edges, reverse=True)
         
         # Sort streaks by streak count (longest first)
-        streaks.sort(key=lambda x: x.get('streak_count', 0), reverse=True)
+        if len(streaks) > 1:
+            streaks.sort(key=lambda x: x.get('streak_count', 0), reverse=True)
         
         # Filter for 70%+ probability props (for high prob section)
         try:
-            high_prob_props = filter_high_probability_props(filtered_edges, min_probability=70.0) if filtered_edges else []
+            high_prob_props = _nba().filter_high_probability_props(filtered_edges, min_probability=70.0) if filtered_edges else []
         except Exception as e:
             print(f"Error filtering high prob props: {e}")
             high_prob_props = []
@@ -573,22 +1071,29 @@ def get_edges_data(show_only_70_plus=True, stat_type='PTS',
             print(f"Error generating parlay recommendations: {e}")
             parlay_recommendations = {}
         
-        return filtered_edges, streaks, high_prob_props, parlay_recommendations, None
+        return filtered_edges, streaks, high_prob_props, parlay_recommendations, calc_error
     except Exception as e:
         error_message = f"Error fetching edges: {str(e)}"
         import traceback
         traceback.print_exc()
         return [], [], [], {}, error_message
 
-@app.route('/health')
+# _compute_edges_data's filter defaults, for normalizing edges cache keys
+_EDGES_DEFAULT_FILTERS = {
+    name: param.default
+    for name, param in inspect.signature(_compute_edges_data).parameters.items()
+    if name != 'projections'
+}
+
+@app.route('/health', provide_automatic_options=False)
 def health():
     """Health check endpoint for deployment platforms - no auth required."""
-    return jsonify({'status': 'ok', 'message': 'App is running'}), 200
+    return _constant_response(_HEALTH_BODY)
 
-@app.route('/ping')
+@app.route('/ping', provide_automatic_options=False)
 def ping():
     """Simple ping endpoint for quick health checks - no auth required."""
-    return 'pong', 200
+    return app.response_class(b'pong', mimetype='text/plain')
 
 @app.route('/')
 @requires_auth
@@ -599,22 +1104,20 @@ def index():
     """
     try:
         # Wrap entire function in try/except to prevent worker crashes
-        global MARKET_PROJECTIONS
-        MARKET_PROJECTIONS = get_market_projections(force_reload=True)  # Always reload to get latest
+        projections = _projections()  # Always reload to get latest
         
         # Auto-load relevant players if projections file is empty or has default values
         # Do this in background to avoid blocking startup
         # Only loads players with hot streaks, positive trends, or role players (not all 500+)
         # Check if we need to trigger background loading (no defaults, so check for empty)
-        should_trigger_load = len(MARKET_PROJECTIONS) == 0
+        should_trigger_load = len(projections) == 0
         
         if should_trigger_load:
             print(f"INFO: No players loaded yet. Using fallback players while loading...")
-            # Immediately set fallback players so UI works
-            MARKET_PROJECTIONS = FALLBACK_PLAYERS.copy()
+            # Immediately show fallback players so UI works (this page only -
+            # the background load installs the real projections)
+            projections = FALLBACK_PLAYERS
             print(f"INFO: Triggering background load...")
-            import threading
-            import time
             def background_load():
                 """Background thread to load players - wrapped in comprehensive error handling."""
                 global MARKET_PROJECTIONS
@@ -628,17 +1131,13 @@ def index():
                 try:
                     # SIMPLIFIED: Just load top 50 active players directly (skip filtering)
                     # This is more reliable and faster
-                    from nba_engine import get_all_active_players, get_season_average
+                    from nba_engine import get_all_active_players, fetch_season_averages
                     
                     print("Fetching active players list...")
                     all_players = get_all_active_players()
                     
                     if not all_players:
                         print("ERROR: No active players available from NBA API")
-                        try:
-                            app._loading_players = False
-                        except:
-                            pass
                         return
                     
                     # FREE TIER: 6 players to balance variety with memory limits
@@ -649,60 +1148,47 @@ def index():
                     loaded_count = 0
                     failed_count = 0
                     
-                    for i, player in enumerate(players_to_load):
+                    # Fetch concurrently - NBA API calls are I/O-bound - with call
+                    # starts throttled to respect rate limits, in player order
+                    players_to_load = [p for p in players_to_load if p.get('id')]
+                    results = fetch_season_averages(players_to_load, 'PTS', '2023-24')
+                    for i, (player, season_avg, error) in enumerate(results):
                         player_name = player.get('full_name', 'Unknown')
-                        player_id = player.get('id')
-                        
-                        if not player_id:
-                            continue
-                        
-                        try:
-                            # Get season average as projection
-                            season_avg = get_season_average(player_id, 'PTS', '2023-24', player_name)
-                            if season_avg and season_avg > 0:
-                                new_projections[player_name] = round(season_avg, 1)
-                                loaded_count += 1
-                            else:
-                                failed_count += 1
-                                # Don't log every failure - many players legitimately have no data
-                            
-                            # Progress logging every 10 players
-                            if (i + 1) % 10 == 0:
-                                print(f"   Progress: {i + 1}/{len(players_to_load)} processed ({loaded_count} loaded, {failed_count} skipped)...")
-                            
-                            # Rate limiting - more conservative to avoid timeouts
-                            if (i + 1) % 10 == 0:
-                                time.sleep(5)  # Longer pause every 10 players
-                            elif (i + 1) % 5 == 0:
-                                time.sleep(2.5)  # Medium pause every 5 players
-                            else:
-                                time.sleep(1.5)  # Increased delay between players
-                            
-                            # Free memory after each player to prevent OOM
-                            import gc
-                            gc.collect()
-                                
-                        except Exception as e:
+                        if error is not None:
                             failed_count += 1
                             # Only log unexpected errors (not "no data" which is normal)
-                            error_str = str(e).lower()
+                            error_str = str(error).lower()
                             if 'no data' not in error_str and 'empty' not in error_str:
-                                print(f"   WARNING: Unexpected error loading {player_name}: {type(e).__name__}: {e}")
-                            continue
+                                print(f"   WARNING: Unexpected error loading {player_name}: {type(error).__name__}: {error}")
+                        elif season_avg and season_avg > 0:
+                            # Season average as projection
+                            new_projections[player_name] = round(season_avg, 1)
+                            loaded_count += 1
+                        else:
+                            failed_count += 1
+                            # Don't log every failure - many players legitimately have no data
+                        
+                        # Progress logging every 10 players
+                        if (i + 1) % 10 == 0:
+                            print(f"   Progress: {i + 1}/{len(players_to_load)} processed ({loaded_count} loaded, {failed_count} skipped)...")
+                    
+                    # Free the API responses in one go to prevent OOM
+                    gc.collect()
                     
                     # No default players - save whatever we loaded
                     # Save if we got at least 1 player
                     if new_projections and len(new_projections) > 0:
-                        if save_projections(new_projections):
+                        with _PROJ_LOCK:
                             MARKET_PROJECTIONS = new_projections
-                            print("=" * 60)
-                            print(f"SUCCESS! Loaded {len(MARKET_PROJECTIONS)} players for PTS")
-                            print(f"   Sample: {', '.join(list(new_projections.keys())[:15])}...")
-                            print("=" * 60)
-                            print(f"Projections saved to {PROJECTIONS_FILE}")
-                            print(f"   Frontend will auto-refresh to show new players")
-                        else:
-                            print("ERROR: Failed to save projections file")
+                            _mark_projections_dirty()
+                        # Build the sample once, after the load loop has finished
+                        sample = ', '.join(islice(new_projections, 15))
+                        print("=" * 60)
+                        print(f"SUCCESS! Loaded {len(MARKET_PROJECTIONS)} players for PTS")
+                        print(f"   Sample: {sample}...")
+                        print("=" * 60)
+                        print(f"Projections queued for save to {PROJECTIONS_FILE}")
+                        print(f"   Frontend will auto-refresh to show new players")
                     else:
                         print(f"WARNING: No players loaded")
                         print("   This might be due to NBA API rate limits or network issues.")
@@ -715,42 +1201,22 @@ def index():
                     print(f"ERROR: Exception in background_load thread: {e}")
                     traceback.print_exc()
                 finally:
-                    # Reset flag when done - wrap in try/except to prevent crashes
+                    # Release the load slot when done - wrap in try/except to prevent crashes
                     try:
-                        app._loading_players = False
+                        _load_event.clear()
                         print("=" * 60)
                         print("Background loading thread completed.")
                         print("=" * 60)
                     except Exception as e:
                         print(f"ERROR: Failed to reset loading flag: {e}", file=sys.stderr)
             
-            # Check if a load is already in progress (simple flag check)
-            if not hasattr(app, '_loading_players'):
-                app._loading_players = False
-            
-            # Import time module for stuck thread detection
-            import time as time_module
-            
-            # Also check if loading flag is stuck (older than 10 minutes = probably crashed)
-            if hasattr(app, '_loading_start_time'):
-                if time_module.time() - app._loading_start_time > 600:  # 10 minutes
-                    print("WARNING: Previous load thread appears stuck (10+ min), resetting flag...")
-                    app._loading_players = False
-            
-            if not app._loading_players:
-                app._loading_players = True
-                app._loading_start_time = time_module.time()  # Track when we started
-                # Start in background thread, don't wait
-                load_thread = threading.Thread(target=background_load, daemon=True)
-                load_thread.start()
+            if _try_begin_load():
+                # Run on the background pool, don't wait
+                _EXECUTOR.submit(background_load)
                 print(f"Started background thread to load players...")
-                print(f"   Current projections: {len(MARKET_PROJECTIONS)} players")
+                print(f"   Current projections: {len(projections)} players")
                 print(f"   Thread will run in background and save to {PROJECTIONS_FILE}")
                 print(f"   Check logs for progress updates...")
-            else:
-                elapsed = int((time_module.time() - app._loading_start_time) / 60) if hasattr(app, '_loading_start_time') else 0
-                print(f"Player loading already in progress (started {elapsed} min ago), skipping duplicate trigger...")
-                print(f"   If stuck, restart the app or wait for completion.")
         
         # Get selected stat type from request or default to PTS
         stat_type = request.args.get('stat_type', 'PTS')
@@ -762,7 +1228,7 @@ def index():
             stat_type = 'PTS'
         
         # If no players, skip edge calculation entirely to prevent timeout
-        if not MARKET_PROJECTIONS or len(MARKET_PROJECTIONS) == 0:
+        if not projections:
             print("INFO: No players loaded, skipping edge calculation to prevent timeout")
             edges = []
             streaks = []
@@ -780,7 +1246,7 @@ def index():
             error = None
             
             try:
-                edges, streaks, high_prob_props, parlay_recommendations, error = get_edges_data(show_only_70_plus=True, stat_type=stat_type)
+                edges, streaks, high_prob_props, parlay_recommendations, error = get_edges_data(projections, show_only_70_plus=True, stat_type=stat_type)
                 # Ensure all are the correct type
                 if not isinstance(edges, list):
                     edges = []
@@ -793,9 +1259,7 @@ def index():
                 if error is None:
                     error = None
             except Exception as e:
-                print(f"Error getting edges data: {e}")
-                import traceback
-                traceback.print_exc()
+                log_error(f"Error getting edges data: {e}")
                 edges, streaks, high_prob_props, parlay_recommendations, error = [], [], [], {}, f"Error loading edges: {str(e)}"
         
         # Get stat categories for UI - with error handling
@@ -809,9 +1273,7 @@ def index():
             individual_stats = get_individual_stats() or {}
             combination_stats = get_combination_stats() or {}
         except Exception as e:
-            print(f"Error getting stat categories: {e}")
-            import traceback
-            traceback.print_exc()
+            log_error(f"Error getting stat categories: {e}")
             # Fallback to default PTS only
             stat_categories = {'PTS': {'name': 'Points', 'abbreviation': 'PTS', 'description': 'Total points scored'}}
             individual_stats = {'PTS': stat_categories['PTS']}
@@ -825,43 +1287,28 @@ def index():
         if not isinstance(combination_stats, dict):
             combination_stats = {}
         
-        # Get glitched props with error handling
-        glitched_props = []
-        try:
-            glitched_props = get_glitched_props() or []
-            if not isinstance(glitched_props, list):
-                glitched_props = []
-        except Exception as e:
-            print(f"Error loading glitched props: {e}")
-            import traceback
-            traceback.print_exc()
-            glitched_props = []
-        
-        return render_template('index.html', 
+        # Glitched props aren't rendered server-side - the page fetches
+        # /api/glitched-props itself. Rendered in full here (not streamed) so
+        # a template error still reaches the error page below.
+        return render_template('index.html',
                              edges=edges, 
                              streaks=streaks, 
                              high_prob_props=high_prob_props, 
                              parlay_recommendations=parlay_recommendations, 
-                             projections=MARKET_PROJECTIONS, 
+                             projections=projections, 
                              error=error,
                              stat_categories=stat_categories,
                              individual_stats=individual_stats,
                              combination_stats=combination_stats,
-                             current_stat_type=stat_type,
-                             glitched_props=glitched_props)
+                             current_stat_type=stat_type)
     except Exception as e:
         import traceback
         error_trace = traceback.format_exc()
         error_type = type(e).__name__
         error_msg = str(e)
-        print("=" * 80, file=sys.stderr)
-        print(f"FATAL ERROR in index route: {error_type}: {error_msg}", file=sys.stderr)
-        print("=" * 80, file=sys.stderr)
-        print(error_trace, file=sys.stderr)
-        print("=" * 80, file=sys.stderr)
-        # Also print to stdout for visibility
-        print(f"FATAL ERROR in index route: {error_type}: {error_msg}")
-        print(error_trace)
+        separator = "=" * 80
+        log_error(f"{separator}\nFATAL ERROR in index route: {error_type}: {error_msg}\n{separator}\n"
+                  f"{error_trace}{separator}", with_traceback=False)
         return f"""
         <html>
         <head><title>Error</title></head>
@@ -876,19 +1323,78 @@ def index():
         </html>
         """, 500
 
-@app.route('/api/edges')
-@requires_auth
-def api_edges():
+def _file_mtime(path):
+    """Return a file's mtime, or 0 if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+# Read-through caches for the small JSON-file-backed lists. Each is keyed on
+# the backing file's mtime, so writes from any process (handlers, scanner,
+# worker.py) invalidate them without explicit cache_clear() calls.
+
+@lru_cache(maxsize=1)
+def _glitched_props_for(_mtime, _minute):
+    return get_glitched_props()
+
+def cached_glitched_props():
+    """get_glitched_props(), re-read when the file changes or the minute
+    rolls over (validation includes how stale each prop is)."""
+    return _glitched_props_for(_file_mtime(GLITCHED_PROPS_FILE), int(time_module.time() // 60))
+
+@lru_cache(maxsize=1)
+def _scan_status_for(_mtime):
+    return get_scan_status()
+
+def cached_scan_status():
+    """get_scan_status(), re-read when the recent scans file changes."""
+    return _scan_status_for(_file_mtime(RECENT_SCANS_FILE))
+
+@lru_cache(maxsize=1)
+def _chase_list_for(_mtime):
+    return get_chase_list()
+
+def cached_chase_list():
+    """get_chase_list(), re-read when the chase list file changes."""
+    return _chase_list_for(_file_mtime(CHASE_LIST_FILE))
+
+@lru_cache(maxsize=32)
+def _alt_lines_for(_mtime, player, stat_type):
+    return get_alt_lines(player, stat_type)
+
+def cached_alt_lines(player, stat_type):
+    """get_alt_lines(), re-read when the alt lines file changes."""
+    return _alt_lines_for(_file_mtime(ALT_LINES_FILE), player, stat_type)
+
+def _edges_etag(tag):
     """
-    API endpoint that returns edges data as JSON for real-time updates.
-    Supports filtering and sorting via query parameters.
+    Weak ETag for /api/edges.
+    
+    Built from the edges cache entry's tag (new for every computed result,
+    so a recompute after the TTL never revalidates the old payload) and what
+    cached_glitched_props() is keyed on.
     """
-    global MARKET_PROJECTIONS
-    # Use get_market_projections to preserve in-memory data when file is empty (ephemeral filesystem)
-    MARKET_PROJECTIONS = get_market_projections(force_reload=True)
+    key = f"{tag}|{_file_mtime(GLITCHED_PROPS_FILE)}|{int(time_module.time() // 60)}"
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+def _query_flag(args, name):
+    """Parse a 'true'/'false' query parameter (default false)."""
+    return args.get(name, 'false').lower() == 'true'
+
+@lru_cache(maxsize=32)
+def _edges_filters(query_string):
+    """
+    Parse the /api/edges query parameters into get_edges_data keyword
+    arguments. Clients poll with the same few query strings, so each
+    distinct one is parsed once.
+    """
+    args = {}
+    for name, value in parse_qsl(query_string.decode('utf-8', 'replace'), keep_blank_values=True):
+        args.setdefault(name, value)  # First value wins, like request.args.get
     
     # Get selected stat type
-    stat_type = request.args.get('stat_type', 'PTS')
+    stat_type = args.get('stat_type', 'PTS')
     try:
         if not is_valid_stat_type(stat_type):
             stat_type = 'PTS'
@@ -897,57 +1403,76 @@ def api_edges():
         stat_type = 'PTS'
     
     # Get filter parameters
-    sort_by = request.args.get('sort_by', 'ev')
-    min_probability = float(request.args.get('min_probability', 70.0))
-    min_ev = float(request.args.get('min_ev', 0.0))
-    min_market_edge = float(request.args.get('min_market_edge', 0.0))
-    min_grade = request.args.get('min_grade') or None
-    positive_ev_only = request.args.get('positive_ev_only', 'false').lower() == 'true'
-    exclude_injuries = request.args.get('exclude_injuries', 'false').lower() == 'true'
-    exclude_rotation = request.args.get('exclude_rotation', 'false').lower() == 'true'
-    
+    min_probability = float(args.get('min_probability', 70.0))
     # If user explicitly set a min_probability, respect it (don't override with 70)
-    show_all = request.args.get('show_all', 'false').lower() == 'true'
+    show_all = _query_flag(args, 'show_all')
     # Also treat explicit min_probability < 70 as "show_all" mode
     if min_probability < 70:
         show_all = True
     
+    return MappingProxyType({
+        'show_only_70_plus': not show_all,
+        'stat_type': stat_type,
+        'sort_by': args.get('sort_by', 'ev'),
+        'min_probability': min_probability,
+        'min_ev': float(args.get('min_ev', 0.0)),
+        'min_market_edge': float(args.get('min_market_edge', 0.0)),
+        'min_grade': args.get('min_grade') or None,
+        'positive_ev_only': _query_flag(args, 'positive_ev_only'),
+        'exclude_injuries': _query_flag(args, 'exclude_injuries'),
+        'exclude_rotation': _query_flag(args, 'exclude_rotation'),
+    })
+
+@app.route('/api/edges')
+@requires_auth
+def api_edges():
+    """
+    API endpoint that returns edges data as JSON for real-time updates.
+    Supports filtering and sorting via query parameters.
+    """
+    # Use get_market_projections to preserve in-memory data when file is empty (ephemeral filesystem)
+    projections = _projections()
+    
+    # Filter/sort parameters, parsed once per distinct query string
+    filters = _edges_filters(request.query_string)
+    
+    tag = None
     try:
-        edges, streaks, high_prob_props, parlay_recommendations, error = get_edges_data(
-            show_only_70_plus=not show_all,
-            stat_type=stat_type,
-            sort_by=sort_by,
-            min_probability=min_probability,
-            min_ev=min_ev,
-            min_market_edge=min_market_edge,
-            min_grade=min_grade,
-            positive_ev_only=positive_ev_only,
-            exclude_injuries=exclude_injuries,
-            exclude_rotation=exclude_rotation
+        (edges, streaks, high_prob_props, parlay_recommendations, error), tag = _get_edges_entry(
+            projections, **filters
         )
     except Exception as e:
         # Log error but don't crash - return empty data instead
         error_type = type(e).__name__
         error_msg = str(e)
-        print(f"WARNING: Error in get_edges_data: {error_type}: {error_msg}")
-        # Only print full traceback for unexpected errors
-        if error_type not in ['KeyError', 'AttributeError', 'ValueError', 'TypeError']:
-            import traceback
-            traceback.print_exc()
+        # Only log the full traceback for unexpected errors
+        log_error(f"WARNING: Error in get_edges_data: {error_type}: {error_msg}",
+                  with_traceback=error_type not in ['KeyError', 'AttributeError', 'ValueError', 'TypeError'])
         edges, streaks, high_prob_props, parlay_recommendations, error = [], [], [], {}, f"Error: {error_msg}"
     
-    return jsonify({
+    # Same cached result as the client already has - let it reuse its
+    # payload. Error results aren't cached, so they never get a tag.
+    etag = _edges_etag(tag) if tag is not None else None
+    if etag is not None and request.if_none_match.contains_weak(etag):
+        not_modified = app.response_class(status=304)
+        not_modified.set_etag(etag, weak=True)
+        return not_modified
+    
+    response = jsonify({
         'edges': edges,
         'streaks': streaks,
         'high_prob_props': high_prob_props,
         'parlay_recommendations': parlay_recommendations,
-        'projections': MARKET_PROJECTIONS,
-        'total_players_loaded': len(MARKET_PROJECTIONS),
-        'showing_70_plus_only': not show_all,
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'projections': projections,
+        'total_players_loaded': len(projections),
+        'showing_70_plus_only': filters['show_only_70_plus'],
+        'timestamp': _iso_now(sep=' '),
         'error': error,
-        'glitched_props': get_glitched_props()
+        'glitched_props': cached_glitched_props()
     })
+    if etag is not None:
+        response.set_etag(etag, weak=True)
+    return response
 
 @app.route('/api/active-players')
 @requires_auth
@@ -956,7 +1481,7 @@ def api_active_players():
     API endpoint that returns all active NBA players.
     """
     try:
-        active_players = get_all_active_players()
+        active_players = _nba().get_all_active_players()
         return jsonify({
             'players': active_players,
             'count': len(active_players)
@@ -977,30 +1502,31 @@ def api_load_all_players():
         season = data.get('season', '2023-24')
         stat_type = data.get('stat_type', 'PTS')
         
-        # Run in background thread to avoid blocking
-        import threading
-        def background_load():
+        # Run on the background pool to avoid blocking
+        def background_load(task_id):
             global MARKET_PROJECTIONS
             try:
                 print("=" * 60)
                 print(f"MANUAL LOAD: Loading all active players for {stat_type}...")
                 print("=" * 60)
-                projections = generate_projections_from_active_players(
+                projections = _nba().generate_projections_from_active_players(
                     stat_type=stat_type,
                     season=season
                 )
                 
                 if projections and len(projections) > 0:
-                    if save_projections(projections):
+                    with _PROJ_LOCK:
                         MARKET_PROJECTIONS = projections
-                        print("=" * 60)
-                        print(f"SUCCESS: Loaded {len(projections)} players for {stat_type}")
-                        print(f"   Sample: {', '.join(list(projections.keys())[:10])}...")
-                        print("=" * 60)
-                    else:
-                        print("ERROR: Failed to save projections file")
+                        _mark_projections_dirty()
+                    print("=" * 60)
+                    print(f"SUCCESS: Loaded {len(projections)} players for {stat_type}")
+                    print(f"   Sample: {', '.join(islice(projections, 10))}...")
+                    print("=" * 60)
+                    _finish_task(task_id, status='done',
+                                 message=f'Loaded {len(projections)} players for {stat_type}')
                 else:
                     print(f"WARNING: No players loaded for {stat_type}")
+                    _finish_task(task_id, status='done', message=f'No players loaded for {stat_type}')
             except Exception as e:
                 print(f"ERROR: Exception in background_load thread: {e}", file=sys.stderr)
                 import traceback
@@ -1008,18 +1534,36 @@ def api_load_all_players():
                 print(error_trace, file=sys.stderr)
                 print(f"ERROR: Exception in background_load thread: {e}")
                 traceback.print_exc()
+                _finish_task(task_id, status='error', error=str(e))
+            finally:
+                # Release the load slot shared with the index() auto-load
+                _load_event.clear()
         
-        # Start background thread
-        thread = threading.Thread(target=background_load, daemon=True)
-        thread.start()
+        # Claim the shared load slot so this and the index() auto-load never
+        # run together, and /api/loading-status reports this load
+        already_running = {
+            'success': False,
+            'status': 'already_running',
+            'error': 'Players are already loading. Check back in a few minutes.'
+        }
+        if not _try_begin_load():
+            return jsonify(already_running), 409
+        
+        # Start on the background pool
+        task_id = _start_task(f'load_all:{stat_type}', background_load, key='load_all')
+        if task_id is None:
+            _load_event.clear()
+            return jsonify(already_running), 409
         
         # Return immediately
         return jsonify({
             'success': True,
             'message': f'Loading players in background for {stat_type}. This may take 10-15 minutes. Check Render logs for progress, then refresh the page.',
-            'status': 'started',
+            'status': 'queued',
+            'task_id': task_id,
+            'poll_url': f'/api/task/{task_id}',
             'note': 'The page will show more players once loading completes. Check the logs for progress.'
-        })
+        }), 202
             
     except Exception as e:
         return jsonify({
@@ -1035,19 +1579,32 @@ def api_projections():
     Returns player count and whether only defaults are loaded.
     """
     try:
-        global MARKET_PROJECTIONS
-        MARKET_PROJECTIONS = get_market_projections(force_reload=True)
+        projections = _cached_projections()
         
         # No default players anymore - check if empty
-        current_players = list(MARKET_PROJECTIONS.keys())
-        is_default_only = len(MARKET_PROJECTIONS) == 0
+        # Only the first 10 names are sent, so don't copy the whole key list
+        current_players = tuple(islice(projections, 10))
+        loading_in_progress = _load_event.is_set()
         
-        return jsonify({
-            'count': len(MARKET_PROJECTIONS),
-            'is_default_only': is_default_only,
-            'current_players': current_players[:10],  # First 10 for preview
-            'loading_in_progress': getattr(app, '_loading_players', False)
-        }), 200
+        # The summary only changes with these - re-encode only when they do
+        summary_key = (len(projections), current_players, loading_in_progress)
+        cached_key, body, etag = _PROJ_SUMMARY['entry']
+        if cached_key != summary_key:
+            body = _json_constant({
+                'count': len(projections),
+                'is_default_only': len(projections) == 0,
+                'current_players': list(current_players),  # First 10 for preview
+                'loading_in_progress': loading_in_progress
+            })
+            etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+            _PROJ_SUMMARY['entry'] = (summary_key, body, etag)
+        
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+        else:
+            response = _constant_response(body)
+        response.set_etag(etag, weak=True)
+        return response
     except Exception as e:
         return jsonify({'error': str(e), 'count': 0, 'is_default_only': True}), 500
 
@@ -1061,11 +1618,10 @@ def api_update_projections():
     try:
         data = request.get_json()
         if 'projections' in data:
-            MARKET_PROJECTIONS = data['projections']
-            if save_projections(MARKET_PROJECTIONS):
-                return jsonify({'success': True, 'message': 'Projections updated'})
-            else:
-                return jsonify({'success': False, 'error': 'Failed to save'}), 500
+            with _PROJ_LOCK:
+                MARKET_PROJECTIONS = data['projections']
+                _mark_projections_dirty()
+            return jsonify({'success': True, 'message': 'Projections updated'})
         else:
             return jsonify({'success': False, 'error': 'No projections provided'}), 400
     except Exception as e:
@@ -1075,42 +1631,146 @@ def api_update_projections():
 @requires_auth
 def api_line_changes():
     """Get line changes since last update."""
-    global MARKET_PROJECTIONS
-    # Use get_market_projections to preserve in-memory data when file is empty (ephemeral filesystem)
-    MARKET_PROJECTIONS = get_market_projections(force_reload=True)
-    changes = track_line_changes(MARKET_PROJECTIONS)
+    # The diff only depends on the projections and the day (it compares
+    # against yesterday's history), so reuse it while both are unchanged.
+    # Read the version first: a write landing in between only costs a
+    # recompute, never a stale diff under the new version.
+    cache_key = (_proj_version, datetime.now().date())
+    # Cached get_market_projections - preserves in-memory data when file is empty (ephemeral filesystem)
+    projections = _cached_projections()
+    
+    cached_key, changes = _LINE_CHANGES_CACHE['entry']
+    if cached_key != cache_key:
+        changes = track_line_changes(projections)
+        _LINE_CHANGES_CACHE['entry'] = (cache_key, changes)
     return jsonify({
         'changes': changes,
         'count': len(changes),
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _iso_now()
     })
 
+# Single-operation helpers shared by the per-op routes and /api/batch.
+# Each takes the request payload, returns the result dict on success and
+# raises ValueError with the client-facing message on failure.
+
+def _do_add_chase(data):
+    """Add a prop to the chase list."""
+    if not add_to_chase_list(data.get('player'), data.get('line'),
+                             data.get('stat_type', 'PTS'), data.get('reason', '')):
+        raise ValueError('Failed to add')
+    return {'message': 'Added to chase list'}
+
+def _do_remove_chase(data):
+    """Remove a prop from the chase list."""
+    if not remove_from_chase_list(data.get('player'), data.get('stat_type', 'PTS')):
+        raise ValueError('Failed to remove')
+    return {'message': 'Removed from chase list'}
+
+# Required fields of the fixed-schema payloads, fetched in one call
+_ALT_LINE_KEYS = operator.itemgetter('player', 'main_line', 'alt_line')
+_UPDATE_LINE_KEYS = operator.itemgetter('player', 'old_line', 'new_line')
+
+def _do_add_alt_line(data):
+    """Record an alternative line for a player."""
+    try:
+        player, main_line, alt_line = _ALT_LINE_KEYS(data)
+    except KeyError:
+        raise ValueError('Missing required fields')
+    if not player or main_line is None or alt_line is None:
+        raise ValueError('Missing required fields')
+    if not add_alt_line(player, main_line, alt_line,
+                        data.get('stat_type', 'PTS'), data.get('source', '')):
+        raise ValueError('Failed to add')
+    return {'message': 'Alternative line added'}
+
+def _do_update_line(data):
+    """Update a player's line in MARKET_PROJECTIONS and track the change."""
+    global MARKET_PROJECTIONS
+    try:
+        player, old_line, new_line = _UPDATE_LINE_KEYS(data)
+    except KeyError:
+        raise ValueError('Missing required fields')
+    stat_type = data.get('stat_type', 'PTS')
+    
+    if not player or old_line is None or new_line is None:
+        raise ValueError('Missing required fields')
+    
+    # Update in projections - re-sending the current line needs no write.
+    # Copy-on-write: readers holding the current dict (and the file cache
+    # it may come from) never see it change under them.
+    with _PROJ_LOCK:
+        if MARKET_PROJECTIONS.get(player) != new_line:
+            updated = dict(MARKET_PROJECTIONS)
+            updated[player] = new_line
+            MARKET_PROJECTIONS = updated
+            _mark_projections_dirty()
+    
+    # Track the change
+    changes = update_line(player, old_line, new_line, stat_type)
+    return {'message': f'Line updated: {old_line} → {new_line}', 'changes': changes}
+
+# Methods accepted by /api/batch
+BATCH_METHODS = {
+    'update_line': _do_update_line,
+    'add_chase': _do_add_chase,
+    'remove_chase': _do_remove_chase,
+    'add_alt_line': _do_add_alt_line,
+}
+
+@app.route('/api/batch', methods=['POST'])
+@requires_auth
+def api_batch():
+    """
+    Run several chase-list / alt-line / update-line operations in one request.
+    
+    Body: {"ops": [{"id": 1, "method": "update_line", "params": {...}}, ...]}
+    Returns one {id, success, result|error} entry per op, in order.
+    Line updates share the debounced projections write, so a batch of them
+    results in a single file write.
+    """
+    data = request.get_json(silent=True) or {}
+    ops = data.get('ops')
+    if not isinstance(ops, list):
+        return jsonify({'success': False, 'error': 'ops must be a list'}), 400
+    
+    results = []
+    for op in ops:
+        if not isinstance(op, dict):
+            results.append({'id': None, 'success': False, 'error': 'Invalid operation'})
+            continue
+        op_id = op.get('id')
+        method = op.get('method')
+        handler = BATCH_METHODS.get(method)
+        if handler is None:
+            results.append({'id': op_id, 'success': False, 'error': f'Unknown method: {method}'})
+            continue
+        
+        params = op.get('params') or {}
+        try:
+            result = handler(params)
+            results.append({'id': op_id, 'success': True, 'result': result})
+        except ValueError as e:
+            results.append({'id': op_id, 'success': False, 'error': str(e)})
+        except Exception as e:
+            print(f"ERROR: Batch op {method} failed: {e}")
+            results.append({'id': op_id, 'success': False, 'error': str(e)})
+    
+    return jsonify({'success': True, 'results': results})
+
 @app.route('/api/chase-list', methods=['GET', 'POST', 'DELETE'])
 @requires_auth
 def api_chase_list():
     """Manage chase list - props to track/follow."""
-    if request.method == 'POST':
-        data = request.get_json()
-        player = data.get('player')
-        line = data.get('line')
-        stat_type = data.get('stat_type', 'PTS')
-        reason = data.get('reason', '')
-        
-        if add_to_chase_list(player, line, stat_type, reason):
-            return jsonify({'success': True, 'message': 'Added to chase list'})
-        return jsonify({'success': False, 'error': 'Failed to add'}), 400
-    
-    elif request.method == 'DELETE':
-        data = request.get_json()
-        player = data.get('player')
-        stat_type = data.get('stat_type', 'PTS')
-        
-        if remove_from_chase_list(player, stat_type):
-            return jsonify({'success': True, 'message': 'Removed from chase list'})
-        return jsonify({'success': False, 'error': 'Failed to remove'}), 400
+    if request.method in ('POST', 'DELETE'):
+        handler = _do_add_chase if request.method == 'POST' else _do_remove_chase
+        try:
+            result = handler(request.get_json())
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        return jsonify({'success': True, **result})
     
     # GET request
-    chase_list = get_chase_list()
+    chase_list = cached_chase_list()
     return jsonify({
         'chase_list': chase_list,
         'count': len(chase_list)
@@ -1121,21 +1781,16 @@ def api_chase_list():
 def api_alt_lines():
     """Manage alternative lines."""
     if request.method == 'POST':
-        data = request.get_json()
-        player = data.get('player')
-        main_line = data.get('main_line')
-        alt_line = data.get('alt_line')
-        stat_type = data.get('stat_type', 'PTS')
-        source = data.get('source', '')
-        
-        if add_alt_line(player, main_line, alt_line, stat_type, source):
-            return jsonify({'success': True, 'message': 'Alternative line added'})
-        return jsonify({'success': False, 'error': 'Failed to add'}), 400
+        try:
+            result = _do_add_alt_line(request.get_json())
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        return jsonify({'success': True, **result})
     
     # GET request
     player = request.args.get('player')
     stat_type = request.args.get('stat_type', 'PTS')
-    alt_lines = get_alt_lines(player, stat_type)
+    alt_lines = cached_alt_lines(player, stat_type)
     return jsonify({
         'alt_lines': alt_lines,
         'player': player,
@@ -1146,28 +1801,11 @@ def api_alt_lines():
 @requires_auth
 def api_update_line():
     """Update a line even after it's been sent off."""
-    global MARKET_PROJECTIONS
-    data = request.get_json()
-    player = data.get('player')
-    old_line = data.get('old_line')
-    new_line = data.get('new_line')
-    stat_type = data.get('stat_type', 'PTS')
-    
-    if not all([player, old_line is not None, new_line is not None]):
-        return jsonify({'success': False, 'error': 'Missing required fields'}), 400
-    
-    # Update in projections
-    MARKET_PROJECTIONS[player] = new_line
-    save_projections(MARKET_PROJECTIONS)
-    
-    # Track the change
-    changes = update_line(player, old_line, new_line, stat_type)
-    
-    return jsonify({
-        'success': True,
-        'message': f'Line updated: {old_line} → {new_line}',
-        'changes': changes
-    })
+    try:
+        result = _do_update_line(request.get_json())
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    return jsonify({'success': True, **result})
 
 @app.route('/api/daily-update-status')
 @requires_auth
@@ -1176,8 +1814,7 @@ def api_daily_update_status():
     global scheduler
     try:
         if scheduler and hasattr(scheduler, 'running') and scheduler.running:
-            jobs = scheduler.get_jobs()
-            daily_job = next((job for job in jobs if job.id == 'daily_update'), None)
+            daily_job = scheduler.get_job('daily_update')
             
             status = {
                 'scheduler_running': True,
@@ -1186,13 +1823,7 @@ def api_daily_update_status():
                 'last_update': None
             }
         else:
-            status = {
-                'scheduler_running': False,
-                'daily_update_scheduled': False,
-                'next_run': None,
-                'last_update': None,
-                'note': 'Scheduler not initialized or not available'
-            }
+            return _constant_response(_SCHEDULER_OFF_BODY)
     except Exception as e:
         status = {
             'scheduler_running': False,
@@ -1207,58 +1838,123 @@ def api_daily_update_status():
 @requires_auth
 def api_loading_status():
     """Get status of background player loading."""
-    loading_in_progress = getattr(app, '_loading_players', False)
-    loading_start_time = getattr(app, '_loading_start_time', None)
-    
-    # Calculate elapsed time if loading
-    elapsed_seconds = None
-    if loading_in_progress and loading_start_time:
-        import time as time_module
-        elapsed_seconds = int(time_module.time() - loading_start_time)
+    elapsed_seconds = _load_elapsed_seconds()
+    loading_in_progress = elapsed_seconds is not None
     
     return jsonify({
         'loading_in_progress': loading_in_progress,
         'player_count': len(MARKET_PROJECTIONS),
-        'started_at': loading_start_time,
+        'started_at': _load_started_wall if loading_in_progress else None,
         'elapsed_seconds': elapsed_seconds,
         'message': 'Loading players in background...' if loading_in_progress else ('Players loaded' if len(MARKET_PROJECTIONS) > 0 else 'No players loaded')
     })
 
-@app.route('/api/trigger-update', methods=['POST'])
-@requires_auth
-def api_trigger_update():
-    """Manually trigger daily update."""
+# Background tasks started from the API, polled via /api/task/<task_id>
+MAX_TRACKED_TASKS = 50
+_TASKS = {}
+_TASKS_LOCK = threading.Lock()
+
+def _start_task(name, target, key=None):
+    """
+    Run target(task_id) on the background pool and return the new task id.
+    With a key, None is returned while a task with the same key is still
+    queued or running.
+    """
+    task_id = uuid.uuid4().hex
+    with _TASKS_LOCK:
+        # Forget the oldest tasks once the table is full
+        while len(_TASKS) >= MAX_TRACKED_TASKS:
+            _TASKS.pop(next(iter(_TASKS)))
+        _TASKS[task_id] = {'name': name, 'status': 'queued', 'started': time_module.time()}
+
+    def run():
+        with _TASKS_LOCK:
+            task = _TASKS.get(task_id)
+            if task is not None:
+                task['status'] = 'running'
+        target(task_id)
+
+    if key is None:
+        _EXECUTOR.submit(run)
+        return task_id
+    if _submit_once(key, run) is None:
+        with _TASKS_LOCK:
+            _TASKS.pop(task_id, None)
+        return None
+    return task_id
+
+def _finish_task(task_id, **fields):
+    """Record a task's final status/result."""
+    with _TASKS_LOCK:
+        task = _TASKS.get(task_id)
+        if task is not None:
+            task.update(fields, finished=time_module.time())
+
+def _run_trigger_update(task_id):
+    """Body of /api/trigger-update, run off the request thread."""
     global MARKET_PROJECTIONS
     try:
         print(f"[{datetime.now()}] Manual update triggered...")
         
         # Auto-load all active players and generate projections
         print("Loading all active NBA players...")
-        new_projections = generate_projections_from_active_players(stat_type='PTS', season='2023-24')
+        new_projections = _nba().generate_projections_from_active_players(stat_type='PTS', season='2023-24')
         
         # Track line changes before updating
-        old_projections = load_projections()
         changes = track_line_changes(new_projections)
         if changes:
             print(f"Line changes detected: {len(changes)} players")
         
-        # Save new projections
-        MARKET_PROJECTIONS = new_projections
-        save_projections(MARKET_PROJECTIONS)
+        # Save new projections now so worker-mode web processes pick them up
+        with _PROJ_LOCK:
+            MARKET_PROJECTIONS = new_projections
+            _mark_projections_dirty()
+        flush_projections_sync()
         
-        # Refresh edges data
-        get_edges_data()
+        # Pre-populate the edges cache for the default view (70%+ PTS)
+        get_edges_data(new_projections)
         
-        return jsonify({
-            'success': True,
-            'message': f'Update triggered successfully. Loaded {len(MARKET_PROJECTIONS)} players.',
-            'timestamp': datetime.now().isoformat()
-        })
+        _finish_task(task_id, status='done',
+                     message=f'Update completed successfully. Loaded {len(new_projections)} players.')
     except Exception as e:
+        print(f"ERROR: Manual update failed: {e}")
+        import traceback
+        traceback.print_exc()
+        _finish_task(task_id, status='error', error=str(e))
+
+@app.route('/api/trigger-update', methods=['POST'])
+@requires_auth
+def api_trigger_update():
+    """
+    Manually trigger daily update.
+    The update takes several minutes, so it runs in the background; poll
+    the returned poll_url for its status.
+    """
+    task_id = _start_task('trigger_update', _run_trigger_update, key='trigger_update')
+    if task_id is None:
         return jsonify({
             'success': False,
-            'error': str(e)
-        }), 500
+            'status': 'already_running',
+            'error': 'An update is already running. Check back in a few minutes.'
+        }), 409
+    return jsonify({
+        'success': True,
+        'task_id': task_id,
+        'status': 'started',
+        'poll_url': f'/api/task/{task_id}',
+        'timestamp': _iso_now()
+    }), 202
+
+@app.route('/api/task/<task_id>')
+@requires_auth
+def api_task_status(task_id):
+    """Get the status of a background task started from the API."""
+    with _TASKS_LOCK:
+        task = _TASKS.get(task_id)
+        task = dict(task) if task is not None else None
+    if task is None:
+        return jsonify({'success': False, 'error': 'Unknown task'}), 404
+    return jsonify({'success': True, 'task_id': task_id, **task})
 
 @app.route('/api/parlay-calculator', methods=['GET', 'POST'])
 @requires_auth
@@ -1268,18 +1964,7 @@ def api_parlay_calculator():
         if request.method == 'GET':
             # ULTRA-MINIMAL MODE: Parlay calculator disabled to save memory
             # Return empty recommendations - feature disabled on free tier
-            return jsonify({
-                'success': True,
-                'recommendations': {
-                    '2_man': [],
-                    '3_man': [],
-                    '4_man': [],
-                    '5_man': [],
-                    '6_man': []
-                },
-                'available_edges': 0,
-                'message': 'Parlay calculator disabled on free tier to prevent crashes. Upgrade to enable.'
-            })
+            return _constant_response(_PARLAY_DISABLED_BODY)
         
         else:  # POST - custom parlay calculation
             data = request.get_json()
@@ -1307,26 +1992,62 @@ def api_parlay_calculator():
             'error': str(e)
         }), 500
 
+# Shared request validation for the glitched props endpoints. Each parser
+# raises ValueError with the client-facing message, answered with a 400.
+GLITCHED_RATING_MIN = 1
+GLITCHED_RATING_MAX = 10
+
+def _parse_rating(value):
+    """Coerce a glitched prop rating to int and check it is in range."""
+    try:
+        rating = int(value)
+    except (TypeError, ValueError):
+        raise ValueError('Rating must be a whole number')
+    if not GLITCHED_RATING_MIN <= rating <= GLITCHED_RATING_MAX:
+        raise ValueError(f'Rating must be between {GLITCHED_RATING_MIN} and {GLITCHED_RATING_MAX}')
+    return rating
+
+def _parse_prop_id(data):
+    """Get the integer prop id from a request payload."""
+    try:
+        return int(data.get('id'))
+    except (TypeError, ValueError):
+        raise ValueError('A numeric prop id is required')
+
+def _glitched_payload():
+    """Parse the request body once; a missing or invalid body is treated as {}."""
+    data = request.get_json(silent=True)
+    return data if isinstance(data, dict) else {}
+
 @app.route('/api/glitched-props', methods=['GET', 'POST', 'PUT', 'DELETE'])
 @requires_auth
 def api_glitched_props():
     """API endpoint for glitched props management."""
     if request.method == 'GET':
-        scan_status = get_scan_status()
-        return jsonify({
-            'success': True,
-            'props': get_glitched_props(),
-            'scan_status': scan_status
-        })
+        # Keyed on the same inputs as the cached readers, so polls between
+        # changes get a 304
+        etag = hashlib.blake2b(
+            f"{_file_mtime(GLITCHED_PROPS_FILE)}|{int(time_module.time() // 60)}|"
+            f"{_file_mtime(RECENT_SCANS_FILE)}".encode(), digest_size=8).hexdigest()
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+        else:
+            scan_status = cached_scan_status()
+            response = jsonify({
+                'success': True,
+                'props': cached_glitched_props(),
+                'scan_status': scan_status
+            })
+        response.set_etag(etag, weak=True)
+        return response
     
     elif request.method == 'POST':
         # Add new glitched prop
         try:
-            data = request.get_json()
-            prop = data.get('prop', '').strip()
-            reasoning = data.get('reasoning', '').strip()
-            rating = int(data.get('rating', 5))
-            platform = data.get('platform', '').strip()
+            data = _glitched_payload()
+            prop = str(data.get('prop') or '').strip()
+            reasoning = str(data.get('reasoning') or '').strip()
+            platform = str(data.get('platform') or '').strip()
             
             if not prop or not reasoning or not platform:
                 return jsonify({
@@ -1334,23 +2055,21 @@ def api_glitched_props():
                     'error': 'Prop, reasoning, and platform are required'
                 }), 400
             
-            if rating < 1 or rating > 10:
-                return jsonify({
-                    'success': False,
-                    'error': 'Rating must be between 1 and 10'
-                }), 400
+            rating = _parse_rating(data.get('rating', 5))
             
             if add_glitched_prop(prop, reasoning, rating, platform):
                 return jsonify({
                     'success': True,
                     'message': 'Glitched prop added successfully',
-                    'props': get_glitched_props()
+                    'props': cached_glitched_props()
                 })
             else:
                 return jsonify({
                     'success': False,
                     'error': 'Failed to save glitched prop'
                 }), 500
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         except Exception as e:
             return jsonify({
                 'success': False,
@@ -1360,30 +2079,29 @@ def api_glitched_props():
     elif request.method == 'PUT':
         # Update glitched prop
         try:
-            data = request.get_json()
-            prop_id = int(data.get('id'))
+            data = _glitched_payload()
+            prop_id = _parse_prop_id(data)
             prop = data.get('prop')
             reasoning = data.get('reasoning')
             rating = data.get('rating')
             platform = data.get('platform')
             
-            if rating is not None and (rating < 1 or rating > 10):
-                return jsonify({
-                    'success': False,
-                    'error': 'Rating must be between 1 and 10'
-                }), 400
+            if rating is not None:
+                rating = _parse_rating(rating)
             
             if update_glitched_prop(prop_id, prop, reasoning, rating, platform):
                 return jsonify({
                     'success': True,
                     'message': 'Glitched prop updated successfully',
-                    'props': get_glitched_props()
+                    'props': cached_glitched_props()
                 })
             else:
                 return jsonify({
                     'success': False,
                     'error': 'Failed to update glitched prop'
                 }), 500
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         except Exception as e:
             return jsonify({
                 'success': False,
@@ -1393,20 +2111,21 @@ def api_glitched_props():
     elif request.method == 'DELETE':
         # Remove glitched prop
         try:
-            data = request.get_json()
-            prop_id = int(data.get('id'))
+            prop_id = _parse_prop_id(_glitched_payload())
             
             if remove_glitched_prop(prop_id):
                 return jsonify({
                     'success': True,
                     'message': 'Glitched prop removed successfully',
-                    'props': get_glitched_props()
+                    'props': cached_glitched_props()
                 })
             else:
                 return jsonify({
                     'success': False,
                     'error': 'Failed to remove glitched prop'
                 }), 500
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         except Exception as e:
             return jsonify({
                 'success': False,
@@ -1426,8 +2145,8 @@ def api_trigger_glitched_scan():
             'success': True,
             'message': f'Quick scan complete! Found {len(found_glitches)} new glitched props.',
             'found_count': len(found_glitches),
-            'props': get_glitched_props(),
-            'scan_status': get_scan_status(),
+            'props': cached_glitched_props(),
+            'scan_status': cached_scan_status(),
             'scan_type': 'quick'
         })
     except Exception as e:
@@ -1445,7 +2164,7 @@ def api_trigger_glitched_scan():
 def api_glitched_scan_status():
     """Get the status of the automated glitched props scanning system."""
     try:
-        status = get_scan_status()
+        status = cached_scan_status()
         return jsonify({
             'success': True,
             'status': status
@@ -1656,7 +2375,8 @@ def yesterdays_bets_page():
 if __name__ == '__main__':
     # Development mode
     try:
-        init_scheduler()
+        if SCHEDULER_ENABLED:
+            init_scheduler()
     except Exception as e:
         print(f"Warning: Scheduler initialization failed: {e}")
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -1665,11 +2385,9 @@ else:
     try:
         app.config['DEBUG'] = False
         # Initialize scheduler for production (delayed to avoid blocking startup)
-        # Use a simple thread to initialize scheduler after app starts
-        import threading
+        # Use the background pool to initialize scheduler after app starts
         def delayed_scheduler_init():
-            import time
-            time.sleep(2)  # Wait 2 seconds for app to fully start
+            time_module.sleep(2)  # Wait 2 seconds for app to fully start
             try:
                 init_scheduler()
             except Exception as e:
@@ -1677,9 +2395,11 @@ else:
                 import traceback
                 traceback.print_exc()
         
-        scheduler_thread = threading.Thread(target=delayed_scheduler_init, daemon=True)
-        scheduler_thread.start()
-        print("App starting in production mode. Scheduler will initialize in background.")
+        if SCHEDULER_ENABLED:
+            _EXECUTOR.submit(delayed_scheduler_init)
+            print("App starting in production mode. Scheduler will initialize in background.")
+        else:
+            print("App starting in production mode. Scheduler disabled (APP_ENABLE_SCHEDULER=0) - run worker.py for scheduled jobs.")
     except Exception as e:
         print(f"Error in production mode initialization: {e}")
         import traceback
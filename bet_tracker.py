@@ -4,28 +4,124 @@ Stores bets with timestamps, odds, results, and calculates ROI.
 """
 import json
 import os
+import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import uuid
 
-BETS_FILE = 'bets_history.json'
+# Faster JSON parsing/encoding when orjson is installed (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Append-only log: one JSON object per line. A line is either a whole bet or
+# a patch ({"op": "update"|"delete", "id": ...}) applied on read, so adding or
+# settling a bet writes one line instead of rewriting the history.
+BETS_FILE = 'bets_history.jsonl'
+LEGACY_BETS_FILE = 'bets_history.json'  # Pre-JSONL storage, migrated on first read
+COMPACT_PATCH_THRESHOLD = 200  # Patch lines allowed before the log is rewritten
+
+# Fields written when a bet is settled
+SETTLE_FIELDS = ('actual_stat', 'settled_at', 'odds_closing', 'result', 'payout', 'profit')
+
+# Held across read-modify-append so appends never interleave with a compaction
+_bets_lock = threading.RLock()
+
+def _encode(record: Dict) -> bytes:
+    """One log line."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8')
+
+# json.loads accepts bytes too, so log lines are read in binary either way
+_decode = orjson.loads if orjson is not None else json.loads
+
+def _migrate_legacy() -> Dict[str, Dict]:
+    """Convert bets_history.json to the JSONL log."""
+    with open(LEGACY_BETS_FILE, 'r') as f:
+        bets = {bet['id']: bet for bet in json.load(f)}
+    if save_bets(list(bets.values())):
+        print(f"Migrated {len(bets)} bets from {LEGACY_BETS_FILE} to {BETS_FILE}")
+    return bets
+
+def _read_log() -> Tuple[Dict[str, Dict], int]:
+    """
+    Replay the bets log.
+    
+    Returns:
+        (bets keyed by id in the order they were added, number of patch lines)
+    """
+    try:
+        f = open(BETS_FILE, 'rb')
+    except FileNotFoundError:
+        if os.path.exists(LEGACY_BETS_FILE):
+            return _migrate_legacy(), 0
+        return {}, 0
+    
+    bets = {}
+    patches = 0
+    with f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = _decode(line)
+            except ValueError:
+                # e.g. a line cut short by a crash mid-append
+                print(f"Skipping unreadable line in {BETS_FILE}")
+                continue
+            if not isinstance(record, dict) or 'id' not in record:
+                print(f"Skipping malformed record in {BETS_FILE}")
+                continue
+            op = record.get('op')
+            if op is None:
+                bets[record['id']] = record
+                continue
+            patches += 1
+            fields = record.get('fields')
+            if op == 'update' and record['id'] in bets and isinstance(fields, dict):
+                bets[record['id']].update(fields)
+            elif op == 'delete':
+                bets.pop(record.get('id'), None)
+    return bets, patches
+
+def _write_patch(record: Dict, bets: Dict[str, Dict], patches: int) -> bool:
+    """
+    Append a patch line, or rewrite the log from bets (which already has
+    the patch applied) once COMPACT_PATCH_THRESHOLD patches pile up.
+    """
+    if patches + 1 >= COMPACT_PATCH_THRESHOLD:
+        return save_bets(list(bets.values()))
+    return _append(record)
+
+def _append(record: Dict) -> bool:
+    try:
+        with open(BETS_FILE, 'ab') as f:
+            f.write(_encode(record))
+        return True
+    except Exception as e:
+        print(f"Error saving bets: {e}")
+        return False
 
 def load_bets() -> List[Dict]:
     """Load all bets from file."""
-    if os.path.exists(BETS_FILE):
-        try:
-            with open(BETS_FILE, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading bets: {e}")
-            return []
-    return []
+    try:
+        with _bets_lock:
+            bets, _ = _read_log()
+        return list(bets.values())
+    except Exception as e:
+        print(f"Error loading bets: {e}")
+        return []
 
 def save_bets(bets: List[Dict]) -> bool:
-    """Save bets to file."""
+    """Rewrite the log as one line per bet, dropping applied patches."""
     try:
-        with open(BETS_FILE, 'w') as f:
-            json.dump(bets, f, indent=2)
+        tmp_path = BETS_FILE + '.tmp'
+        with _bets_lock:
+            with open(tmp_path, 'wb') as f:
+                f.writelines(_encode(bet) for bet in bets)
+            os.replace(tmp_path, BETS_FILE)
         return True
     except Exception as e:
         print(f"Error saving bets: {e}")
@@ -59,8 +155,7 @@ def add_bet(
     Returns:
         The created bet dict or None on error
     """
-    bets = load_bets()
-    
+    now = datetime.now()
     bet = {
         'id': str(uuid.uuid4())[:8],
         'player': player,
@@ -73,8 +168,8 @@ def add_bet(
         'platform': platform,
         'confidence_grade': confidence_grade,
         'confidence_score': confidence_score,
-        'time_placed': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'game_date': datetime.now().strftime('%Y-%m-%d'),
+        'time_placed': now.strftime('%Y-%m-%d %H:%M:%S'),
+        'game_date': now.strftime('%Y-%m-%d'),
         'result': None,  # WIN, LOSS, PUSH, PENDING
         'actual_stat': None,
         'payout': None,
@@ -82,20 +177,25 @@ def add_bet(
         'settled_at': None
     }
     
-    bets.append(bet)
-    if save_bets(bets):
-        return bet
+    with _bets_lock:
+        # Migrate a legacy file first so the new bet isn't the only one kept
+        if not os.path.exists(BETS_FILE) and os.path.exists(LEGACY_BETS_FILE):
+            _read_log()
+        if _append(bet):
+            return bet
     return None
 
 def update_closing_odds(bet_id: str, closing_odds: int) -> Optional[Dict]:
     """Update the closing odds for a bet."""
-    bets = load_bets()
-    for bet in bets:
-        if bet['id'] == bet_id:
-            bet['odds_closing'] = closing_odds
-            save_bets(bets)
-            return bet
-    return None
+    with _bets_lock:
+        bets, patches = _read_log()
+        bet = bets.get(bet_id)
+        if bet is None:
+            return None
+        bet['odds_closing'] = closing_odds
+        if not _write_patch({'op': 'update', 'id': bet_id, 'fields': {'odds_closing': closing_odds}}, bets, patches):
+            return None
+        return bet
 
 def settle_bet(bet_id: str, actual_stat: float, closing_odds: int = None) -> Optional[Dict]:
     """
@@ -109,47 +209,51 @@ def settle_bet(bet_id: str, actual_stat: float, closing_odds: int = None) -> Opt
     Returns:
         Updated bet dict or None
     """
-    bets = load_bets()
-    for bet in bets:
-        if bet['id'] == bet_id:
-            bet['actual_stat'] = actual_stat
-            bet['settled_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            if closing_odds:
-                bet['odds_closing'] = closing_odds
-            
-            # Determine result
-            line = bet['line']
-            pick = bet['pick']
-            
-            if actual_stat > line:
-                bet['result'] = 'WIN' if pick == 'OVER' else 'LOSS'
-            elif actual_stat < line:
-                bet['result'] = 'WIN' if pick == 'UNDER' else 'LOSS'
+    with _bets_lock:
+        bets, patches = _read_log()
+        bet = bets.get(bet_id)
+        if bet is None:
+            return None
+        
+        bet['actual_stat'] = actual_stat
+        bet['settled_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        if closing_odds:
+            bet['odds_closing'] = closing_odds
+        
+        # Determine result
+        line = bet['line']
+        pick = bet['pick']
+        
+        if actual_stat > line:
+            bet['result'] = 'WIN' if pick == 'OVER' else 'LOSS'
+        elif actual_stat < line:
+            bet['result'] = 'WIN' if pick == 'UNDER' else 'LOSS'
+        else:
+            bet['result'] = 'PUSH'
+        
+        # Calculate payout and profit
+        stake = bet['stake']
+        odds = bet['odds_placed']
+        
+        if bet['result'] == 'WIN':
+            if odds > 0:
+                payout = stake + (stake * odds / 100)
             else:
-                bet['result'] = 'PUSH'
-            
-            # Calculate payout and profit
-            stake = bet['stake']
-            odds = bet['odds_placed']
-            
-            if bet['result'] == 'WIN':
-                if odds > 0:
-                    payout = stake + (stake * odds / 100)
-                else:
-                    payout = stake + (stake * 100 / abs(odds))
-                bet['payout'] = round(payout, 2)
-                bet['profit'] = round(payout - stake, 2)
-            elif bet['result'] == 'PUSH':
-                bet['payout'] = stake
-                bet['profit'] = 0
-            else:  # LOSS
-                bet['payout'] = 0
-                bet['profit'] = -stake
-            
-            save_bets(bets)
-            return bet
-    return None
+                payout = stake + (stake * 100 / abs(odds))
+            bet['payout'] = round(payout, 2)
+            bet['profit'] = round(payout - stake, 2)
+        elif bet['result'] == 'PUSH':
+            bet['payout'] = stake
+            bet['profit'] = 0
+        else:  # LOSS
+            bet['payout'] = 0
+            bet['profit'] = -stake
+        
+        fields = {field: bet[field] for field in SETTLE_FIELDS}
+        if not _write_patch({'op': 'update', 'id': bet_id, 'fields': fields}, bets, patches):
+            return None
+        return bet
 
 def get_bets_by_date(date_str: str) -> List[Dict]:
     """Get all bets for a specific date."""
@@ -177,6 +281,12 @@ def get_recent_bets(days: int = 7) -> List[Dict]:
     cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
     return [b for b in bets if b.get('game_date', '') >= cutoff]
 
+def _implied_probability(american_odds: int) -> float:
+    """Implied win probability of American odds."""
+    if american_odds < 0:
+        return abs(american_odds) / (abs(american_odds) + 100)
+    return 100 / (american_odds + 100)
+
 def calculate_roi(bets: List[Dict]) -> Dict:
     """
     Calculate ROI and stats for a list of bets.
@@ -201,54 +311,55 @@ def calculate_roi(bets: List[Dict]) -> Dict:
             'clv': 0  # Closing Line Value
         }
     
-    settled = [b for b in bets if b.get('result') and b['result'] != 'PENDING']
-    pending = [b for b in bets if not b.get('result') or b['result'] == 'PENDING']
-    
-    wins = len([b for b in settled if b['result'] == 'WIN'])
-    losses = len([b for b in settled if b['result'] == 'LOSS'])
-    pushes = len([b for b in settled if b['result'] == 'PUSH'])
+    settled_count = pending_count = 0
+    wins = losses = pushes = 0
+    total_stake = total_profit = 0
+    odds_placed_total = 0
+    odds_closing_total = odds_closing_count = 0
+    clv_total = clv_count = 0
     
-    total_stake = sum(b.get('stake', 0) for b in settled)
-    total_profit = sum(b.get('profit', 0) for b in settled if b.get('profit') is not None)
+    # One pass over the history
+    for b in bets:
+        result = b.get('result')
+        if not result or result == 'PENDING':
+            pending_count += 1
+            continue
+        
+        settled_count += 1
+        if result == 'WIN':
+            wins += 1
+        elif result == 'LOSS':
+            losses += 1
+        elif result == 'PUSH':
+            pushes += 1
+        
+        total_stake += b.get('stake', 0)
+        if b.get('profit') is not None:
+            total_profit += b['profit']
+        
+        odds_placed_total += b.get('odds_placed', -110)
+        closing = b.get('odds_closing')
+        if closing:
+            odds_closing_total += closing
+            odds_closing_count += 1
+            
+            # CLV (Closing Line Value) - measures if you beat the closing line.
+            # Closing implied - placed implied (positive = got better odds)
+            if b.get('odds_placed'):
+                clv_total += (_implied_probability(closing) - _implied_probability(b['odds_placed'])) * 100
+                clv_count += 1
     
     roi_pct = (total_profit / total_stake * 100) if total_stake > 0 else 0
     win_rate = (wins / (wins + losses) * 100) if (wins + losses) > 0 else 0
     
-    # Calculate average odds
-    odds_placed = [b.get('odds_placed', -110) for b in settled]
-    odds_closing = [b.get('odds_closing') for b in settled if b.get('odds_closing')]
-    
-    avg_odds_placed = sum(odds_placed) / len(odds_placed) if odds_placed else 0
-    avg_odds_closing = sum(odds_closing) / len(odds_closing) if odds_closing else 0
-    
-    # Calculate CLV (Closing Line Value) - measures if you beat the closing line
-    clv_total = 0
-    clv_count = 0
-    for b in settled:
-        if b.get('odds_placed') and b.get('odds_closing'):
-            placed = b['odds_placed']
-            closing = b['odds_closing']
-            # Convert to implied probability to compare
-            if placed < 0:
-                implied_placed = abs(placed) / (abs(placed) + 100)
-            else:
-                implied_placed = 100 / (placed + 100)
-            
-            if closing < 0:
-                implied_closing = abs(closing) / (abs(closing) + 100)
-            else:
-                implied_closing = 100 / (closing + 100)
-            
-            # CLV = closing implied - placed implied (positive = got better odds)
-            clv_total += (implied_closing - implied_placed) * 100
-            clv_count += 1
-    
+    avg_odds_placed = odds_placed_total / settled_count if settled_count else 0
+    avg_odds_closing = odds_closing_total / odds_closing_count if odds_closing_count else 0
     clv = clv_total / clv_count if clv_count > 0 else 0
     
     return {
         'total_bets': len(bets),
-        'settled_bets': len(settled),
-        'pending_bets': len(pending),
+        'settled_bets': settled_count,
+        'pending_bets': pending_count,
         'wins': wins,
         'losses': losses,
         'pushes': pushes,
@@ -263,12 +374,11 @@ def calculate_roi(bets: List[Dict]) -> Dict:
 
 def delete_bet(bet_id: str) -> bool:
     """Delete a bet by ID."""
-    bets = load_bets()
-    original_len = len(bets)
-    bets = [b for b in bets if b['id'] != bet_id]
-    if len(bets) < original_len:
-        return save_bets(bets)
-    return False
+    with _bets_lock:
+        bets, patches = _read_log()
+        if bets.pop(bet_id, None) is None:
+            return False
+        return _write_patch({'op': 'delete', 'id': bet_id}, bets, patches)
 
 def get_all_bets() -> List[Dict]:
     """Get all bets."""
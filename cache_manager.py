@@ -1,13 +1,33 @@
 """
 Simple caching system for NBA API responses to reduce API calls and improve performance.
+Entries live in one SQLite table shared by every process on the host.
 """
 import json
 import os
-from datetime import datetime, timedelta
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
 from functools import wraps
 
+# Faster JSON parsing/encoding when orjson is installed (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 CACHE_DIR = 'cache'
+CACHE_DB = os.path.join(CACHE_DIR, 'api_cache.db')
 CACHE_DURATION = timedelta(hours=1)  # Cache for 1 hour
+MEM_CACHE_MAX = 256  # Parsed cache entries kept in memory
+
+# cache_key -> (cached_at, data). Repeat hits skip the query and parse.
+_mem_cache = OrderedDict()
+_mem_cache_lock = threading.Lock()
+
+# sqlite3 connections can't be shared between threads - one per thread
+_local = threading.local()
 
 def ensure_cache_dir():
     """Create cache directory if it doesn't exist."""
@@ -18,32 +38,60 @@ def get_cache_key(player_name, stat_type, season, games):
     """Generate a cache key for a player's stats."""
     return f"{player_name}_{stat_type}_{season}_{games}"
 
-def get_cache_file_path(cache_key):
-    """Get the file path for a cache key."""
+def _connection():
+    """This thread's connection to CACHE_DB, creating the table on first use."""
+    conn = getattr(_local, 'conn', None)
+    if conn is not None and _local.path == CACHE_DB:
+        return conn
+    if conn is not None:
+        conn.close()
     ensure_cache_dir()
-    # Sanitize filename
-    safe_key = "".join(c if c.isalnum() or c in ('_', '-') else '_' for c in cache_key)
-    return os.path.join(CACHE_DIR, f"{safe_key}.json")
+    # Autocommit: every statement is its own transaction
+    conn = sqlite3.connect(CACHE_DB, timeout=10, isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, ts REAL NOT NULL, data BLOB NOT NULL)')
+    _local.conn = conn
+    _local.path = CACHE_DB
+    return conn
+
+def _encode(data):
+    if orjson is not None:
+        # Game logs come from pandas rows, so values may be numpy scalars
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def _decode(blob):
+    return orjson.loads(blob) if orjson is not None else json.loads(blob)
+
+def _remember(cache_key, cached_at, data):
+    """Keep a parsed entry in memory, evicting the least recently used."""
+    with _mem_cache_lock:
+        _mem_cache[cache_key] = (cached_at, data)
+        _mem_cache.move_to_end(cache_key)
+        while len(_mem_cache) > MEM_CACHE_MAX:
+            _mem_cache.popitem(last=False)
 
 def get_cached_data(cache_key):
     """Retrieve cached data if it exists and is still valid."""
-    cache_file = get_cache_file_path(cache_key)
+    cutoff = time.time() - CACHE_DURATION.total_seconds()
     
-    if not os.path.exists(cache_file):
-        return None
+    with _mem_cache_lock:
+        entry = _mem_cache.get(cache_key)
+        if entry is not None:
+            if entry[0] > cutoff:
+                _mem_cache.move_to_end(cache_key)
+                return entry[1]
+            del _mem_cache[cache_key]
     
     try:
-        with open(cache_file, 'r') as f:
-            cache_data = json.load(f)
-        
-        # Check if cache is still valid
-        cached_time = datetime.fromisoformat(cache_data.get('timestamp', ''))
-        if datetime.now() - cached_time > CACHE_DURATION:
-            # Cache expired, delete it
-            os.remove(cache_file)
+        row = _connection().execute(
+            'SELECT ts, data FROM cache WHERE key = ? AND ts > ?', (cache_key, cutoff)
+        ).fetchone()
+        if row is None:
             return None
-        
-        return cache_data.get('data')
+        data = _decode(row[1])
+        _remember(cache_key, row[0], data)
+        return data
     except Exception as e:
         print(f"Error reading cache: {e}")
         return None
@@ -51,32 +99,22 @@ def get_cached_data(cache_key):
 def set_cached_data(cache_key, data):
     """Store data in cache."""
     try:
-        cache_file = get_cache_file_path(cache_key)
-        cache_data = {
-            'timestamp': datetime.now().isoformat(),
-            'data': data
-        }
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f, indent=2)
+        cached_at = time.time()
+        _connection().execute(
+            'INSERT OR REPLACE INTO cache (key, ts, data) VALUES (?, ?, ?)',
+            (cache_key, cached_at, _encode(data))
+        )
+        _remember(cache_key, cached_at, data)
     except Exception as e:
         print(f"Error writing cache: {e}")
 
 def clear_old_cache():
-    """Remove expired cache files."""
-    ensure_cache_dir()
+    """Remove expired cache entries."""
+    if not os.path.exists(CACHE_DB):
+        return
     try:
-        for filename in os.listdir(CACHE_DIR):
-            if filename.endswith('.json'):
-                filepath = os.path.join(CACHE_DIR, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        cache_data = json.load(f)
-                    cached_time = datetime.fromisoformat(cache_data.get('timestamp', ''))
-                    if datetime.now() - cached_time > CACHE_DURATION:
-                        os.remove(filepath)
-                except:
-                    # If we can't read it, delete it
-                    os.remove(filepath)
+        _connection().execute('DELETE FROM cache WHERE ts < ?',
+                              (time.time() - CACHE_DURATION.total_seconds(),))
     except Exception as e:
         print(f"Error clearing cache: {e}")
 
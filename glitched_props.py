@@ -9,6 +9,12 @@ import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
+# Faster JSON parsing/encoding when orjson is installed (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 GLITCHED_PROPS_FILE = 'glitched_props.json'
 
 # Valid source types
@@ -20,22 +26,40 @@ RATING_MAX = 10
 STALE_THRESHOLD_HOURS = 24  # Data older than this is considered stale
 WARNING_THRESHOLD_HOURS = 6  # Data older than this shows warning
 
+# Built once - validate_glitched_prop runs for every prop on every read
+LINE_NUMBER_RE = re.compile(r'\d+\.?\d*')
+REQUIRED_FIELDS = ('prop', 'platform', 'reasoning')
+VALID_PLATFORMS = frozenset(['PrizePicks', 'Underdog', 'DraftKings', 'FanDuel', 'BetMGM', 'Caesars', 'PointsBet', 'Other'])
+
 def load_glitched_props():
     """Load glitched props from file."""
-    if os.path.exists(GLITCHED_PROPS_FILE):
-        try:
-            with open(GLITCHED_PROPS_FILE, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading glitched props: {e}")
-            return []
-    return []
+    try:
+        if orjson is not None:
+            with open(GLITCHED_PROPS_FILE, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(GLITCHED_PROPS_FILE, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+    except Exception as e:
+        print(f"Error loading glitched props: {e}")
+        return []
 
 def save_glitched_props(props: List[Dict]):
-    """Save glitched props to file."""
+    """
+    Save glitched props to file.
+    Written to a temp file and swapped in, so readers (the app caches the
+    parsed file by mtime) never see a half-written file.
+    """
+    tmp_path = GLITCHED_PROPS_FILE + '.tmp'
     try:
-        with open(GLITCHED_PROPS_FILE, 'w') as f:
-            json.dump(props, f, indent=2)
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(props, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w') as f:
+                json.dump(props, f, indent=2)
+        os.replace(tmp_path, GLITCHED_PROPS_FILE)
         return True
     except Exception as e:
         print(f"Error saving glitched props: {e}")
@@ -71,6 +95,8 @@ def add_glitched_prop(prop: str, reasoning: str, rating: int, platform: str,
             'api': 'External API'
         }.get(source, 'Unknown')
     
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
     # Check if prop already exists
     for existing in props:
         if existing.get('prop') == prop and existing.get('platform') == platform:
@@ -79,7 +105,7 @@ def add_glitched_prop(prop: str, reasoning: str, rating: int, platform: str,
             existing['rating'] = rating
             existing['source'] = source
             existing['source_detail'] = source_detail
-            existing['updated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            existing['updated_at'] = timestamp
             return save_glitched_props(props)
     
     # Add new prop
@@ -91,18 +117,19 @@ def add_glitched_prop(prop: str, reasoning: str, rating: int, platform: str,
         'platform': platform,
         'source': source,
         'source_detail': source_detail,
-        'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        'created_at': timestamp,
+        'updated_at': timestamp
     }
     props.append(new_prop)
     return save_glitched_props(props)
 
-def validate_glitched_prop(prop: Dict) -> Dict:
+def validate_glitched_prop(prop: Dict, now: Optional[datetime] = None) -> Dict:
     """
     Validate a glitched prop and return validation status with warnings.
     
     Args:
         prop: The prop dictionary to validate
+        now: Time to measure staleness against (default: datetime.now())
         
     Returns:
         Dict with 'is_valid', 'warnings', 'is_stale', 'staleness_level'
@@ -121,13 +148,12 @@ def validate_glitched_prop(prop: Dict) -> Dict:
     
     # Check prop format - should contain a number (the line)
     prop_text = prop.get('prop', '')
-    if not re.search(r'\d+\.?\d*', prop_text):
+    if not LINE_NUMBER_RE.search(prop_text):
         warnings.append('No line number found in prop')
         is_valid = False
     
     # Check for required fields
-    required_fields = ['prop', 'platform', 'reasoning']
-    for field in required_fields:
+    for field in REQUIRED_FIELDS:
         if not prop.get(field):
             warnings.append(f'Missing required field: {field}')
             is_valid = False
@@ -137,7 +163,7 @@ def validate_glitched_prop(prop: Dict) -> Dict:
     if updated_at:
         try:
             update_time = datetime.strptime(updated_at, '%Y-%m-%d %H:%M:%S')
-            hours_old = (datetime.now() - update_time).total_seconds() / 3600
+            hours_old = ((now or datetime.now()) - update_time).total_seconds() / 3600
             
             if hours_old >= STALE_THRESHOLD_HOURS:
                 is_stale = True
@@ -154,9 +180,8 @@ def validate_glitched_prop(prop: Dict) -> Dict:
         staleness_level = 'stale'
     
     # Check platform is valid
-    valid_platforms = ['PrizePicks', 'Underdog', 'DraftKings', 'FanDuel', 'BetMGM', 'Caesars', 'PointsBet', 'Other']
     platform = prop.get('platform', '')
-    if platform and platform not in valid_platforms:
+    if platform and platform not in VALID_PLATFORMS:
         warnings.append(f'Unknown platform: {platform}')
     
     return {
@@ -176,6 +201,7 @@ def get_glitched_props(include_validation: bool = True):
         include_validation: If True, include validation status for each prop
     """
     props = load_glitched_props()
+    now = datetime.now()  # One staleness reference for the whole list
     
     # Add validation info and ensure source fields exist
     for prop in props:
@@ -187,7 +213,7 @@ def get_glitched_props(include_validation: bool = True):
         
         # Add validation if requested
         if include_validation:
-            prop['validation'] = validate_glitched_prop(prop)
+            prop['validation'] = validate_glitched_prop(prop, now)
     
     # Sort by rating descending, then by updated_at descending
     props.sort(key=lambda x: (x.get('rating', 0), x.get('updated_at', '')), reverse=True)
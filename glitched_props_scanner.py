@@ -4,7 +4,7 @@ Scans betting platforms around the clock to find pricing errors and glitched pro
 """
 import json
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
@@ -20,6 +20,7 @@ from glitched_props import add_glitched_prop, get_glitched_props
 
 # Configuration
 SCAN_INTERVAL_MINUTES = 5  # Background scan every 5 minutes (for duplicate checking)
+SCAN_WORKERS = 8  # Players whose platform lines are fetched at once (calls are still throttled)
 PLATFORMS = ['PrizePicks', 'Underdog', 'DraftKings', 'FanDuel', 'BetMGM', 'Caesars', 'PointsBet']
 
 # Cache for recent scans to avoid duplicates
@@ -36,10 +37,12 @@ def load_recent_scans():
     return {}
 
 def save_recent_scans(scans: Dict):
-    """Save recent scan results."""
+    """Save recent scan results (via a temp file, like save_glitched_props)."""
+    tmp_path = RECENT_SCANS_FILE + '.tmp'
     try:
-        with open(RECENT_SCANS_FILE, 'w') as f:
+        with open(tmp_path, 'w') as f:
             json.dump(scans, f, indent=2)
+        os.replace(tmp_path, RECENT_SCANS_FILE)
     except Exception as e:
         print(f"Error saving recent scans: {e}")
 
@@ -78,12 +81,15 @@ def compare_lines_across_platforms(player_name: str, stat_type: str = 'PTS'):
     Returns:
         dict: Glitched prop info if found, None otherwise
     """
+    from nba_engine import throttled_call
+    
     platform_lines = {}
     
-    # Fetch lines from all platforms
+    # Fetch lines from all platforms - each call waits for its slot in the
+    # shared request schedule, however many scan workers are running
     for platform in PLATFORMS:
         try:
-            line_data = fetch_platform_lines(platform, player_name, stat_type)
+            line_data = throttled_call(fetch_platform_lines, platform, player_name, stat_type)
             if line_data and 'line' in line_data:
                 platform_lines[platform] = line_data['line']
         except Exception as e:
@@ -227,7 +233,7 @@ def get_relevant_players_for_today():
     
     return relevant_players
 
-def scan_active_players_for_glitches(quick_scan=False, max_players=None):
+def scan_active_players_for_glitches(quick_scan=False, max_players=None, max_workers=SCAN_WORKERS):
     """
     Scan relevant players for glitched props across platforms.
     Focuses on:
@@ -238,6 +244,7 @@ def scan_active_players_for_glitches(quick_scan=False, max_players=None):
     Args:
         quick_scan: If True, only scan top 10-20 players for instant results
         max_players: Maximum number of players to scan (None = all relevant)
+        max_workers: How many players' platform lines are fetched concurrently
     
     This is the main scanning function that runs periodically.
     """
@@ -263,25 +270,37 @@ def scan_active_players_for_glitches(quick_scan=False, max_players=None):
         
         recent_scans = load_recent_scans()
         found_glitches = []
-        scanned_count = 0
         
+        # Skip players we scanned recently before fetching anything
+        now = datetime.now()
+        due_players = []
         for player_data in players_to_scan:
-            player = player_data['player']
-            player_name = player_data['player_name']
-            reasons = player_data['reasons']
-            scanned_count += 1
-            
-            # Check if we recently scanned this player
-            scan_key = f"{player_name}_PTS"
-            last_scan = recent_scans.get(scan_key, {}).get('last_scan')
-            if last_scan:
-                last_scan_time = datetime.fromisoformat(last_scan)
-                if datetime.now() - last_scan_time < timedelta(minutes=SCAN_INTERVAL_MINUTES):
-                    continue  # Skip if scanned recently
-            
+            last_scan = recent_scans.get(f"{player_data['player_name']}_PTS", {}).get('last_scan')
+            if last_scan and now - datetime.fromisoformat(last_scan) < timedelta(minutes=SCAN_INTERVAL_MINUTES):
+                continue
+            due_players.append(player_data)
+        
+        def fetch(player_data):
+            # Scan for PTS first (most common)
             try:
-                # Scan for PTS first (most common)
-                glitch = compare_lines_across_platforms(player_name, 'PTS')
+                return compare_lines_across_platforms(player_data['player_name'], 'PTS'), None
+            except Exception as e:
+                return None, e
+        
+        # The platform fetches are I/O bound, so run them concurrently; their
+        # start times are spaced by nba_engine.throttled_call, so more workers
+        # overlap slow responses without raising the request rate. Results
+        # come back in player order and are recorded on this thread.
+        with ThreadPoolExecutor(max_workers=max(1, max_workers or 1), thread_name_prefix='glitch-scan') as executor:
+            for scanned_count, (player_data, (glitch, error)) in enumerate(
+                    zip(due_players, executor.map(fetch, due_players)), 1):
+                player_name = player_data['player_name']
+                reasons = player_data['reasons']
+                scan_key = f"{player_name}_PTS"
+                
+                if error is not None:
+                    print(f"Error scanning {player_name}: {error}")
+                    continue
                 
                 if glitch:
                     # Enhance reasoning with why this player was selected
@@ -301,36 +320,21 @@ def scan_active_players_for_glitches(quick_scan=False, max_players=None):
                             found_glitches.append(glitch)
                             print(f"Found glitched prop: {prop_text} on {glitch['platform']} (Rating: {glitch['rating']}/10)")
                             print(f"  Reasons: {', '.join(reasons)}")
-                    
-                    # Update recent scans
-                    recent_scans[scan_key] = {
-                        'last_scan': datetime.now().isoformat(),
-                        'found_glitch': True,
-                        'reasons': reasons
-                    }
-                else:
-                    # Update recent scans even if no glitch found
-                    recent_scans[scan_key] = {
-                        'last_scan': datetime.now().isoformat(),
-                        'found_glitch': False,
-                        'reasons': reasons
-                    }
                 
-                # Rate limiting - be respectful
-                time.sleep(2)  # 2 seconds between players
+                # Update recent scans whether or not a glitch was found
+                recent_scans[scan_key] = {
+                    'last_scan': datetime.now().isoformat(),
+                    'found_glitch': bool(glitch),
+                    'reasons': reasons
+                }
                 
-            except Exception as e:
-                print(f"Error scanning {player_name}: {e}")
-                continue
-            
-            # Progress update every 5 players (since we're scanning fewer now)
-            if scanned_count % 5 == 0:
-                print(f"   Progress: {scanned_count}/{len(players_to_scan)} players scanned, {len(found_glitches)} glitches found...")
+                if scanned_count % 25 == 0:
+                    print(f"   Progress: {scanned_count}/{len(due_players)} players scanned, {len(found_glitches)} glitches found...")
         
         # Save recent scans
         save_recent_scans(recent_scans)
         
-        print(f"Scan complete: {scanned_count} players scanned, {len(found_glitches)} new glitched props found")
+        print(f"Scan complete: {len(due_players)} players scanned, {len(found_glitches)} new glitched props found")
         
         return found_glitches
         
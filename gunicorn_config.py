@@ -10,7 +10,11 @@ bind = f"0.0.0.0:{port}"
 # Worker configuration - use 1 worker to reduce crashes and memory usage
 # CRITICAL: Only 1 worker to prevent multiple worker crashes
 workers = 1
-worker_class = "sync"
+# Threads share the single worker's memory, so slow I/O-bound requests
+# (NBA API calls, file reads) no longer block every other request.
+# GUNICORN_WORKER_CLASS=gevent switches to green threads (needs gevent installed).
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('GUNICORN_THREADS', '4'))
 worker_connections = 1000
 timeout = 360  # 6 minutes - must be longer than edge calculation timeout (5 min) to allow graceful timeout
 keepalive = 5
@@ -7,6 +7,12 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+# Faster JSON parsing/encoding when orjson is installed (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 LINES_HISTORY_FILE = 'lines_history.json'
 CHASE_LIST_FILE = 'chase_list.json'
 ALT_LINES_FILE = 'alt_lines.json'
@@ -15,20 +21,33 @@ def load_json_file(filename, default=None):
     """Load JSON file or return default."""
     if default is None:
         default = {}
-    if os.path.exists(filename):
-        try:
-            with open(filename, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading {filename}: {e}")
-            return default
-    return default
+    try:
+        if orjson is not None:
+            with open(filename, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(filename, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except Exception as e:
+        print(f"Error loading {filename}: {e}")
+        return default
 
 def save_json_file(filename, data):
-    """Save data to JSON file."""
+    """
+    Save data to JSON file.
+    Written compactly to a temp file and swapped in, so a crash mid-write
+    never leaves a truncated file behind.
+    """
+    tmp_path = filename + '.tmp'
     try:
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, filename)
         return True
     except Exception as e:
         print(f"Error saving {filename}: {e}")
@@ -42,16 +61,22 @@ def track_line_changes(current_lines: Dict[str, float], stat_type='PTS'):
         dict: Line changes with old/new values and movement direction
     """
     history = load_json_file(LINES_HISTORY_FILE, {})
-    today = datetime.now().strftime('%Y-%m-%d')
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+    timestamp = now.isoformat()
     
     # Get yesterday's lines
-    yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+    yesterday = (now - timedelta(days=1)).strftime('%Y-%m-%d')
     previous_lines = history.get(yesterday, {})
     
+    # Diff against yesterday and build today's history entry in one pass
     changes = {}
+    today_lines = {}
+    suffix = f"_{stat_type}"
     
     for player, current_line in current_lines.items():
-        key = f"{player}_{stat_type}"
+        key = player + suffix
+        today_lines[key] = current_line
         previous_line = previous_lines.get(key)
         
         if previous_line is not None and previous_line != current_line:
@@ -62,14 +87,10 @@ def track_line_changes(current_lines: Dict[str, float], stat_type='PTS'):
                 'movement': round(movement, 1),
                 'direction': 'up' if movement > 0 else 'down',
                 'stat_type': stat_type,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp
             }
     
     # Save today's lines to history
-    today_lines = {}
-    for player, line in current_lines.items():
-        today_lines[f"{player}_{stat_type}"] = line
-    
     history[today] = today_lines
     save_json_file(LINES_HISTORY_FILE, history)
     
@@ -104,6 +125,7 @@ def get_line_changes(stat_type='PTS'):
 def add_to_chase_list(player: str, line: float, stat_type: str, reason: str = ""):
     """Add a prop to the chase list."""
     chase_list = load_json_file(CHASE_LIST_FILE, [])
+    now = datetime.now().isoformat()
     
     # Check if already in list
     for item in chase_list:
@@ -111,7 +133,7 @@ def add_to_chase_list(player: str, line: float, stat_type: str, reason: str = ""
             # Update existing
             item['line'] = line
             item['reason'] = reason
-            item['updated'] = datetime.now().isoformat()
+            item['updated'] = now
             save_json_file(CHASE_LIST_FILE, chase_list)
             return True
     
@@ -121,8 +143,8 @@ def add_to_chase_list(player: str, line: float, stat_type: str, reason: str = ""
         'line': line,
         'stat_type': stat_type,
         'reason': reason,
-        'added': datetime.now().isoformat(),
-        'updated': datetime.now().isoformat(),
+        'added': now,
+        'updated': now,
         'status': 'active'
     })
     
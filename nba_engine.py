@@ -3,9 +3,13 @@ from nba_api.stats.endpoints import playergamelog, playercareerstats, teamgamelo
 # Note: scoreboard removed - not available in all nba_api versions
 from nba_api.stats.static import players, teams
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import math
 import re
+from dataclasses import dataclass
+from typing import Optional
 from cache_manager import get_cache_key, get_cached_data, set_cached_data
 from requests.exceptions import Timeout, ConnectionError, RequestException
 import requests
@@ -743,6 +747,44 @@ def get_season_average(player_id, stat_type='PTS', season='2023-24', player_name
             traceback.print_exc()
         return None
 
+# Bulk fetches run concurrently, but NBA API call starts are spaced at least
+# API_MIN_INTERVAL apart across all threads to stay under the rate limit
+API_WORKERS = 4
+API_MIN_INTERVAL = 1.5  # seconds
+_api_throttle_lock = threading.Lock()
+_api_next_call = 0.0  # time.monotonic() before which the next call may not start
+
+def throttled_call(fn, *args, **kwargs):
+    """Call fn once its turn in the shared API_MIN_INTERVAL schedule comes up."""
+    global _api_next_call
+    with _api_throttle_lock:
+        now = time.monotonic()
+        start_at = max(now, _api_next_call)
+        _api_next_call = start_at + API_MIN_INTERVAL
+    if start_at > now:
+        time.sleep(start_at - now)
+    return fn(*args, **kwargs)
+
+def fetch_season_averages(player_list, stat_type='PTS', season='2023-24', max_workers=API_WORKERS):
+    """
+    Fetch season averages for many players concurrently.
+    
+    Requests overlap while their start times are throttled; results are
+    yielded in player_list order as (player, average, error), where error is
+    the exception raised for that player or None.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='nba-api') as pool:
+        futures = [
+            pool.submit(throttled_call, get_season_average, player['id'], stat_type=stat_type,
+                        season=season, player_name=player.get('full_name'))
+            for player in player_list
+        ]
+        for player, future in zip(player_list, futures):
+            try:
+                yield player, future.result(), None
+            except Exception as e:
+                yield player, None, e
+
 def generate_projections_from_active_players(stat_type='PTS', season='2023-24', min_games=10, use_season_avg=True):
     """
     Generate projections for all active players based on their season averages.
@@ -763,37 +805,26 @@ def generate_projections_from_active_players(stat_type='PTS', season='2023-24',
     successful = 0
     failed = 0
     
-    for i, player in enumerate(active_players):
+    # Fetch concurrently - the serial loop with sleeps took 10-15 minutes
+    results = fetch_season_averages(active_players, stat_type=stat_type, season=season)
+    for i, (player, avg, error) in enumerate(results):
         player_name = player['full_name']
-        player_id = player['id']
         
-        try:
-            # Get season average as projection
-            # For combination stats, get_season_average handles it
-            avg = get_season_average(player_id, stat_type=stat_type, season=season, player_name=player_name)
-            
-            if avg is not None:
-                # Use season average as the projection line
-                projections[player_name] = round(avg, 1)
-                successful += 1
-            else:
-                failed += 1
-                # Only log if it's a real error (not just no data for this season)
-                # The get_season_average function already logs specific issues
-        except Exception as e:
-            error_type = type(e).__name__
-            print(f"   ❌ Exception getting {player_name} (ID: {player_id}): {error_type}: {e}")
+        if error is not None:
+            error_type = type(error).__name__
+            print(f"   ❌ Exception getting {player_name} (ID: {player['id']}): {error_type}: {error}")
+            failed += 1
+        elif avg is not None:
+            # Use season average as the projection line
+            projections[player_name] = round(avg, 1)
+            successful += 1
+        else:
             failed += 1
-            continue
+            # Only log if it's a real error (not just no data for this season)
+            # The get_season_average function already logs specific issues
         
-        # Rate limiting - be more conservative with bulk operations to avoid timeouts
         if (i + 1) % 10 == 0:
             print(f"   📈 Progress: {i + 1}/{len(active_players)} players processed ({successful} successful, {failed} failed)...")
-            time.sleep(5)  # Longer delay every 10 players to avoid rate limits and timeouts
-        elif (i + 1) % 5 == 0:
-            time.sleep(2.5)  # Medium delay every 5 players
-        else:
-            time.sleep(1.5)  # Increased delay between players to reduce timeout risk
     
     print(f"✅ Generated projections for {len(projections)} players ({successful} successful, {failed} failed)")
     if len(projections) < 10:
@@ -1130,9 +1161,13 @@ def filter_high_probability_props(edges, min_probability=70.0):
     
     for edge in edges:
         factors = edge.get('factors', {})
-        streak_info = edge.get('streak', {}) if edge.get('streak', {}).get('active') else None
+        streak = edge.get('streak') or {}
+        streak_info = streak if streak.get('active') else None
         
-        probability = calculate_hit_probability(edge, factors, streak_info)
+        # Reuse the probability the caller already computed for this edge
+        probability = edge.get('probability')
+        if probability is None:
+            probability = calculate_hit_probability(edge, factors, streak_info)
         
         if probability >= min_probability:
             reasoning = generate_high_probability_reasoning(edge, factors, streak_info, probability)
@@ -1398,6 +1433,43 @@ def identify_statistical_beneficiary(edge_data, stat_type='PTS', season='2023-24
         'defensive_data': defensive_stats
     }
 
+# Optional Edge fields, emitted by to_dict() only when set
+_EDGE_OPTIONAL_FIELDS = ('streak', 'factors', 'advanced_metrics')
+
+@dataclass(slots=True)
+class Edge:
+    """
+    A betting edge found by check_for_edges.
+    
+    Built with a fixed set of slots while the edge is assembled, then handed
+    downstream as a plain dict via to_dict().
+    """
+    player: str
+    line: float
+    average: float
+    difference: float
+    recommendation: str
+    stat_type: str
+    streak: Optional[dict] = None
+    factors: Optional[dict] = None
+    advanced_metrics: Optional[dict] = None
+    
+    def to_dict(self):
+        """Return the edge as a dict with a fixed key order."""
+        edge_data = {
+            'player': self.player,
+            'line': self.line,
+            'average': self.average,
+            'difference': self.difference,
+            'recommendation': self.recommendation,
+            'stat_type': self.stat_type
+        }
+        for field_name in _EDGE_OPTIONAL_FIELDS:
+            value = getattr(self, field_name)
+            if value is not None:
+                edge_data[field_name] = value
+        return edge_data
+
 def check_for_edges(projections, threshold=2.0, stat_type='PTS', season='2023-24', include_streaks=True, min_streak=2, include_factors=True):
     """
     Check for betting edges by comparing recent performance vs projections.
@@ -1443,42 +1515,48 @@ def check_for_edges(projections, threshold=2.0, stat_type='PTS', season='2023-24
             diff = avg - line
             if abs(diff) > threshold:
                 status = "OVER" if avg > line else "UNDER"
-                edge_data = {
-                    'player': player_name,
-                    'line': line,
-                    'average': round(avg, 1),
-                    'difference': round(abs(diff), 1),
-                    'recommendation': status,
-                    'stat_type': stat_type
-                }
+                edge = Edge(
+                    player=player_name,
+                    line=line,
+                    average=round(avg, 1),
+                    difference=round(abs(diff), 1),
+                    recommendation=status,
+                    stat_type=stat_type
+                )
                 
                 # Add streak info if requested (use enhanced analytics)
                 streak_info = None
                 if include_streaks:
                     enhanced_streak = calculate_enhanced_streak_analytics(player_name, line, stat_type, season, min_streak)
-                    edge_data['streak'] = enhanced_streak
+                    edge.streak = enhanced_streak
                     streak_info = enhanced_streak  # For backwards compatibility
                 
                 # Add performance factors
                 if factors:
-                    edge_data['factors'] = factors
+                    edge.factors = factors
                     # Add advanced metrics
                     games_list = fetch_recent_games(player_name, stat_type, season, games=5)
                     if games_list:
                         advanced = calculate_advanced_metrics(games_list)
                         if advanced:
-                            edge_data['advanced_metrics'] = advanced
+                            edge.advanced_metrics = advanced
+                
+                # Both helpers read the same snapshot; the verdict keeps it as
+                # its 'edge', so the emitted dict is a copy rather than the
+                # snapshot itself (no edge -> oracle -> edge cycle)
+                edge_data = edge.to_dict()
                 
                 # Generate Oracle verdict
                 oracle_verdict = generate_oracle_verdict(edge_data, factors, streak_info if include_streaks else None)
-                edge_data['oracle'] = oracle_verdict
                 
                 # Phase 2: Statistical Beneficiary analysis
                 beneficiary_analysis = identify_statistical_beneficiary(edge_data, stat_type, season)
-                if beneficiary_analysis:
-                    edge_data['beneficiary'] = beneficiary_analysis
                 
-                edges.append(edge_data)
+                edge_out = dict(edge_data)
+                edge_out['oracle'] = oracle_verdict
+                if beneficiary_analysis:
+                    edge_out['beneficiary'] = beneficiary_analysis
+                edges.append(edge_out)
         
         # Check for streaks (even if not an edge) - use enhanced analytics
         if include_streaks:
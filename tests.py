@@ -5,6 +5,8 @@ Run with: python -m pytest tests.py -v
 import sys
 import os
 import json
+import time
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
 
@@ -119,6 +121,42 @@ class TestParlayCalculator(unittest.TestCase):
             self.assertIn('payout', result[0])
 
 
+class TestAdvancedAnalytics(unittest.TestCase):
+    """Test advanced analytics filters"""
+    
+    def test_apply_tactical_filters_probability(self):
+        """Test probability filter keeps only edges at or above the minimum"""
+        from advanced_analytics import apply_tactical_filters
+        
+        edges = [
+            {'player': 'Player1', 'probability': 75},
+            {'player': 'Player2', 'probability': 65},
+            {'player': 'Player3', 'probability': 70}
+        ]
+        result = apply_tactical_filters(edges, {'min_probability': 70.0})
+        
+        self.assertEqual([e['player'] for e in result], ['Player1', 'Player3'])
+    
+    def test_apply_tactical_filters_combined(self):
+        """Test all active filters are applied together"""
+        from advanced_analytics import apply_tactical_filters
+        
+        edges = [
+            {'player': 'Player1', 'probability': 80, 'is_positive_ev': True, 'factors': {'injury_risk': True}},
+            {'player': 'Player2', 'probability': 80, 'is_positive_ev': False, 'factors': {}},
+            {'player': 'Player3', 'probability': 80, 'is_positive_ev': True, 'factors': {}}
+        ]
+        filters = {
+            'min_probability': 70.0,
+            'positive_ev_only': True,
+            'exclude_injuries': True,
+            'min_grade': None
+        }
+        result = apply_tactical_filters(edges, filters)
+        
+        self.assertEqual([e['player'] for e in result], ['Player3'])
+
+
 class TestStatCategories(unittest.TestCase):
     """Test stat categories module"""
     
@@ -170,6 +208,67 @@ class TestLineTracker(unittest.TestCase):
         self.assertIsInstance(changes, dict)
 
 
+class TestCacheManager(unittest.TestCase):
+    """Test the API response cache"""
+    
+    def test_entries_round_trip_and_expire(self):
+        """Test entries are served from memory, then the database, until they expire"""
+        import tempfile
+        import cache_manager
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch.object(cache_manager, 'CACHE_DIR', tmp_dir), \
+                patch.object(cache_manager, 'CACHE_DB', os.path.join(tmp_dir, 'cache.db')), \
+                patch.object(cache_manager, '_mem_cache', cache_manager.OrderedDict()):
+            self.assertIsNone(cache_manager.get_cached_data('key'))
+            cache_manager.set_cached_data('key', [1, 2])
+            with patch.object(cache_manager, '_connection', side_effect=AssertionError("database read")):
+                self.assertEqual(cache_manager.get_cached_data('key'), [1, 2])
+            
+            # Another process's entry - only in the database
+            cache_manager._mem_cache.clear()
+            self.assertEqual(cache_manager.get_cached_data('key'), [1, 2])
+            
+            later = time.time() + cache_manager.CACHE_DURATION.total_seconds() + 1
+            with patch.object(cache_manager.time, 'time', return_value=later):
+                self.assertIsNone(cache_manager.get_cached_data('key'))
+                cache_manager.clear_old_cache()
+            count = cache_manager._connection().execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+            self.assertEqual(count, 0)
+            cache_manager._connection().close()
+            cache_manager._local.conn = None
+
+
+class TestNbaEngine(unittest.TestCase):
+    """Test NBA API helpers that don't hit the network"""
+    
+    def test_throttled_calls_are_spaced(self):
+        """Test throttled calls start at least API_MIN_INTERVAL apart"""
+        import nba_engine
+        from concurrent.futures import ThreadPoolExecutor
+        with patch.object(nba_engine, 'API_MIN_INTERVAL', 0.05):
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                starts = sorted(pool.map(lambda _: nba_engine.throttled_call(time.monotonic), range(3)))
+        for earlier, later in zip(starts, starts[1:]):
+            self.assertGreaterEqual(later - earlier, 0.04)
+    
+    def test_fetch_season_averages_keeps_player_order(self):
+        """Test concurrent fetches yield results and errors in player order"""
+        import nba_engine
+        def fake_average(player_id, stat_type='PTS', season='2023-24', player_name=None):
+            if player_id == 2:
+                raise ValueError("no data")
+            time.sleep(0.01 * (3 - player_id))
+            return float(player_id)
+        player_list = [{'id': 1, 'full_name': 'A'}, {'id': 2, 'full_name': 'B'}, {'id': 3, 'full_name': 'C'}]
+        with patch.object(nba_engine, 'get_season_average', side_effect=fake_average), \
+                patch.object(nba_engine, 'API_MIN_INTERVAL', 0):
+            results = list(nba_engine.fetch_season_averages(player_list))
+        self.assertEqual([p['full_name'] for p, _, _ in results], ['A', 'B', 'C'])
+        self.assertEqual(results[0][1], 1.0)
+        self.assertIsInstance(results[1][2], ValueError)
+        self.assertEqual(results[2][1], 3.0)
+
+
 class TestFlaskApp(unittest.TestCase):
     """Test Flask application routes"""
     
@@ -216,6 +315,43 @@ class TestFlaskApp(unittest.TestCase):
         """Test index page with authentication"""
         response = self.client.get('/', headers=self.get_auth_headers())
         self.assertEqual(response.status_code, 200)
+        self.assertIn(b'</html>', response.data)
+    
+    def test_index_template_error_shows_error_page(self):
+        """Test a rendering failure returns the error page, not a cut-off 200"""
+        import app as app_module
+        with patch.object(app_module, 'render_template', side_effect=RuntimeError("broken template")), \
+                patch.object(app_module, '_try_begin_load', return_value=False), \
+                patch.object(app_module, 'get_edges_data', return_value=([], [], [], {}, None)):
+            response = self.client.get('/', headers=self.get_auth_headers())
+        self.assertEqual(response.status_code, 500)
+
+    def test_requests_never_rebind_shared_projections(self):
+        """Test a page view with no players shows fallbacks without replacing MARKET_PROJECTIONS"""
+        import app as app_module
+        shared = app_module.MARKET_PROJECTIONS
+        with patch.object(app_module, '_projections', return_value={}), \
+                patch.object(app_module, '_try_begin_load', return_value=False):
+            response = self.client.get('/', headers=self.get_auth_headers())
+            self.assertEqual(response.status_code, 200)
+            response.get_data()
+            response = self.client.get('/api/edges', headers=self.get_auth_headers())
+            self.assertEqual(response.status_code, 200)
+        self.assertIs(app_module.MARKET_PROJECTIONS, shared)
+
+    def test_update_line_replaces_projections_dict(self):
+        """Test a line update installs a new dict instead of mutating the shared one"""
+        import app as app_module
+        original = {'Player1': 20.5}
+        try:
+            with patch.object(app_module, 'MARKET_PROJECTIONS', original), \
+                    patch.object(app_module, 'update_line', return_value={}), \
+                    patch.object(app_module, '_mark_projections_dirty'):
+                app_module._do_update_line({'player': 'Player1', 'old_line': 20.5, 'new_line': 22.5})
+                self.assertEqual(original, {'Player1': 20.5})
+                self.assertEqual(app_module.MARKET_PROJECTIONS, {'Player1': 22.5})
+        finally:
+            app_module._dirty.clear()
     
     def test_api_edges_requires_auth(self):
         """Test /api/edges requires authentication"""
@@ -228,7 +364,48 @@ class TestFlaskApp(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         data = json.loads(response.data)
         self.assertIn('edges', data)
-    
+
+    def test_api_edges_not_modified(self):
+        """Test /api/edges returns 304 for a matching If-None-Match"""
+        response = self.client.get('/api/edges?stat_type=PTS', headers=self.get_auth_headers())
+        etag, is_weak = response.get_etag()
+        if not etag:
+            self.skipTest("Edges request returned an error payload")
+        self.assertTrue(is_weak)
+        headers = self.get_auth_headers()
+        headers['If-None-Match'] = f'W/"{etag}"'
+        response = self.client.get('/api/edges?stat_type=PTS', headers=headers)
+        if response.status_code == 200:
+            # Projections changed in between (background load) - tag must too
+            self.assertNotEqual(response.get_etag()[0], etag)
+        else:
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.data, b'')
+
+    def test_edges_etag_follows_cached_result(self):
+        """Test a recomputed or failed edges result never revalidates an old tag"""
+        import app as app_module
+        ok = ([], [], [], {}, None)
+        timed_out = ([], [], [], {}, 'Edge calculation timed out')
+        app_module.clear_edges_cache()
+        with patch.object(app_module, '_compute_edges_data', return_value=ok):
+            etag = self.client.get('/api/edges', headers=self.get_auth_headers()).get_etag()[0]
+            self.assertTrue(etag)
+            headers = self.get_auth_headers()
+            headers['If-None-Match'] = f'W/"{etag}"'
+            self.assertEqual(self.client.get('/api/edges', headers=headers).status_code, 304)
+            # The entry expired - the fresh result gets a fresh tag
+            app_module.clear_edges_cache()
+            response = self.client.get('/api/edges', headers=headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response.get_etag()[0], etag)
+        app_module.clear_edges_cache()
+        with patch.object(app_module, '_compute_edges_data', return_value=timed_out):
+            response = self.client.get('/api/edges', headers=headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertIsNone(response.get_etag()[0])
+            self.assertEqual(app_module._EDGES_CACHE, {})
+
     def test_api_line_changes(self):
         """Test /api/line-changes endpoint"""
         response = self.client.get('/api/line-changes', headers=self.get_auth_headers())
@@ -236,6 +413,19 @@ class TestFlaskApp(unittest.TestCase):
         data = json.loads(response.data)
         self.assertIn('changes', data)
     
+    def test_api_line_changes_reuses_diff_until_projections_change(self):
+        """Test /api/line-changes only recomputes after a projections write"""
+        import app as app_module
+        with patch.object(app_module, 'track_line_changes', return_value=[]) as track:
+            app_module._LINE_CHANGES_CACHE['entry'] = (None, None)
+            self.client.get('/api/line-changes', headers=self.get_auth_headers())
+            self.client.get('/api/line-changes', headers=self.get_auth_headers())
+            self.assertEqual(track.call_count, 1)
+            with app_module._PROJ_LOCK:
+                app_module._bump_projections_version()
+            self.client.get('/api/line-changes', headers=self.get_auth_headers())
+            self.assertEqual(track.call_count, 2)
+    
     def test_api_chase_list(self):
         """Test /api/chase-list endpoint"""
         response = self.client.get('/api/chase-list', headers=self.get_auth_headers())
@@ -250,6 +440,22 @@ class TestFlaskApp(unittest.TestCase):
         data = json.loads(response.data)
         self.assertIn('alt_lines', data)
     
+    def test_api_batch(self):
+        """Test /api/batch returns one ordered result per op"""
+        ops = [
+            {'id': 1, 'method': 'update_line', 'params': {}},
+            {'id': 2, 'method': 'no_such_method'},
+        ]
+        response = self.client.post('/api/batch', json={'ops': ops}, headers=self.get_auth_headers())
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertEqual([r['id'] for r in data['results']], [1, 2])
+        self.assertEqual(data['results'][0]['error'], 'Missing required fields')
+        self.assertFalse(data['results'][1]['success'])
+
+        response = self.client.post('/api/batch', json={}, headers=self.get_auth_headers())
+        self.assertEqual(response.status_code, 400)
+
     def test_api_parlay_calculator_get(self):
         """Test /api/parlay-calculator GET endpoint"""
         response = self.client.get('/api/parlay-calculator', headers=self.get_auth_headers())
@@ -265,6 +471,274 @@ class TestFlaskApp(unittest.TestCase):
         data = json.loads(response.data)
         self.assertTrue(data['success'])
     
+    def test_background_load_claimed_once(self):
+        """Test only one caller can claim the background load slot"""
+        import app as app_module
+        if app_module._load_event.is_set():
+            self.skipTest("A background load is already running")
+        try:
+            self.assertTrue(app_module._try_begin_load())
+            self.assertFalse(app_module._try_begin_load())
+            self.assertIsNotNone(app_module._load_elapsed_seconds())
+        finally:
+            app_module._load_event.clear()
+        self.assertIsNone(app_module._load_elapsed_seconds())
+
+    def test_load_all_players_refused_while_loading(self):
+        """Test a manual load is refused while another load holds the slot"""
+        import app as app_module
+        if app_module._load_event.is_set():
+            self.skipTest("A background load is already running")
+        self.assertTrue(app_module._try_begin_load())
+        try:
+            response = self.client.post('/api/load-all-players', json={'stat_type': 'PTS'},
+                                        headers=self.get_auth_headers())
+            self.assertEqual(response.status_code, 409)
+            self.assertFalse(json.loads(response.data)['success'])
+        finally:
+            app_module._load_event.clear()
+
+    def test_cached_projections_reused_within_ttl(self):
+        """Test projections are served from cache until a save invalidates it"""
+        import app as app_module
+        first = app_module._cached_projections()
+        self.assertIs(app_module._cached_projections(), first)
+        app_module._PROJ_CACHE['ts'] = 0.0
+        self.assertIsInstance(app_module._cached_projections(), dict)
+
+    def test_flush_projections_only_when_dirty(self):
+        """Test the write-behind flush writes once and only when dirty"""
+        import app as app_module
+        with patch.object(app_module, 'save_projections', return_value=True) as save:
+            app_module._dirty.set()
+            self.assertTrue(app_module.flush_projections_sync())
+            self.assertFalse(app_module.flush_projections_sync())
+            self.assertEqual(save.call_count, 1)
+
+    def test_failed_save_removes_temp_file(self):
+        """Test a failed projections write doesn't leave projections.json.tmp behind"""
+        import tempfile
+        import app as app_module
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'projections.json')
+            with patch.object(app_module, 'PROJECTIONS_FILE', path), \
+                    patch.object(app_module.os, 'replace', side_effect=OSError("read-only")):
+                self.assertFalse(app_module.save_projections({'Player1': 20.5}))
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+    def test_failed_flush_keeps_projections_dirty(self):
+        """Test a failed projections write is retried by the next flush"""
+        import app as app_module
+        try:
+            with patch.object(app_module, 'MARKET_PROJECTIONS', {'Player1': 20.5}), \
+                    patch.object(app_module, 'save_projections', return_value=False) as save:
+                app_module._dirty.set()
+                self.assertFalse(app_module.flush_projections_sync())
+                self.assertTrue(app_module._dirty.is_set())
+                save.side_effect = OSError("disk full")
+                with self.assertRaises(OSError):
+                    app_module.flush_projections_sync()
+                self.assertTrue(app_module._dirty.is_set())
+        finally:
+            app_module._dirty.clear()
+
+    def test_edges_warmup_survives_flush_and_reload(self):
+        """Test the post-update warm-up entry serves the next request"""
+        import tempfile
+        import app as app_module
+        result = ([], [], [], {}, None)
+        new_projections = {'Player1': 20.5, 'Player2': 18.5}
+        app_module.clear_edges_cache()
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch.object(app_module, 'PROJECTIONS_FILE', os.path.join(tmp_dir, 'projections.json')), \
+                patch.object(app_module, 'MARKET_PROJECTIONS', {}), \
+                patch.object(app_module, '_compute_edges_data', return_value=result) as compute:
+            with app_module._PROJ_LOCK:
+                app_module.MARKET_PROJECTIONS = new_projections
+                app_module._mark_projections_dirty()
+            app_module.flush_projections_sync()
+            app_module.get_edges_data(new_projections)
+            with app_module.app.test_request_context('/'):
+                app_module.get_edges_data()
+            self.assertEqual(compute.call_count, 1)
+        app_module.clear_edges_cache()
+
+    def test_file_backed_lists_cached_until_file_changes(self):
+        """Test chase list reads are reused while the file is unchanged"""
+        import app as app_module
+        self.assertIs(app_module.cached_chase_list(), app_module.cached_chase_list())
+        with patch.object(app_module, '_file_mtime', return_value=-1):
+            self.assertIsInstance(app_module.cached_chase_list(), list)
+
+    def test_api_task_status(self):
+        """Test background tasks can be polled via /api/task/<id>"""
+        import app as app_module
+        task_id = app_module._start_task('test', lambda tid: app_module._finish_task(tid, status='done'))
+        for _ in range(50):
+            response = self.client.get(f'/api/task/{task_id}', headers=self.get_auth_headers())
+            data = json.loads(response.data)
+            if data['status'] not in ('queued', 'running'):
+                break
+            time.sleep(0.05)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['status'], 'done')
+
+        response = self.client.get('/api/task/does-not-exist', headers=self.get_auth_headers())
+        self.assertEqual(response.status_code, 404)
+
+    def test_keyed_task_refused_while_running(self):
+        """Test a keyed task can't be queued twice and is visible via /api/task"""
+        import app as app_module
+        release = threading.Event()
+        def target(tid):
+            release.wait(5)
+            app_module._finish_task(tid, status='done')
+        task_id = app_module._start_task('test', target, key='test:keyed')
+        try:
+            self.assertIsNotNone(task_id)
+            self.assertIsNone(app_module._start_task('test', target, key='test:keyed'))
+            response = self.client.get(f'/api/task/{task_id}', headers=self.get_auth_headers())
+            self.assertEqual(response.status_code, 200)
+            self.assertIn(json.loads(response.data)['status'], ('queued', 'running'))
+        finally:
+            release.set()
+
+    def test_api_glitched_props_validation(self):
+        """Test invalid glitched prop payloads are rejected with 400"""
+        headers = self.get_auth_headers()
+        response = self.client.put('/api/glitched-props', json={'id': 1, 'rating': 11}, headers=headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('between 1 and 10', json.loads(response.data)['error'])
+
+        response = self.client.delete('/api/glitched-props', json={}, headers=headers)
+        self.assertEqual(response.status_code, 400)
+
+    def test_api_projections_not_modified(self):
+        """Test /api/projections returns 304 for a matching If-None-Match"""
+        response = self.client.get('/api/projections', headers=self.get_auth_headers())
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('count', json.loads(response.data))
+        etag = response.get_etag()[0]
+        headers = self.get_auth_headers()
+        headers['If-None-Match'] = f'W/"{etag}"'
+        response = self.client.get('/api/projections', headers=headers)
+        if response.status_code == 200:
+            # Projections or loading state changed in between - tag must too
+            self.assertNotEqual(response.get_etag()[0], etag)
+        else:
+            self.assertEqual(response.status_code, 304)
+
+    def test_api_glitched_props_not_modified(self):
+        """Test GET /api/glitched-props returns 304 for a matching If-None-Match"""
+        response = self.client.get('/api/glitched-props', headers=self.get_auth_headers())
+        self.assertEqual(response.status_code, 200)
+        etag = response.get_etag()[0]
+        headers = self.get_auth_headers()
+        headers['If-None-Match'] = f'W/"{etag}"'
+        response = self.client.get('/api/glitched-props', headers=headers)
+        if response.status_code == 200:
+            # The minute rolled over in between - tag must change too
+            self.assertNotEqual(response.get_etag()[0], etag)
+        else:
+            self.assertEqual(response.status_code, 304)
+
+    def test_load_projections_cached_by_mtime(self):
+        """Test unchanged projections files are parsed only once"""
+        import tempfile
+        import app as app_module
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'projections.json')
+            with patch.object(app_module, 'PROJECTIONS_FILE', path):
+                projections = {'Player1': 20.5}
+                self.assertTrue(app_module.save_projections(projections))
+                self.assertIs(app_module.load_projections(), projections)
+                with open(path, 'w') as f:
+                    json.dump({'Player2': 18.5, 'Player3': 22.5}, f)
+                self.assertEqual(app_module.load_projections(), {'Player2': 18.5, 'Player3': 22.5})
+
+    def test_edges_data_cached_per_filters(self):
+        """Test identical get_edges_data calls share one computation"""
+        import app as app_module
+        projections = {'Player1': 20.5}
+        result = ([], [], [], {}, None)
+        app_module.clear_edges_cache()
+        with patch.object(app_module, '_compute_edges_data', return_value=result) as compute:
+            app_module.get_edges_data(projections, stat_type='PTS')
+            app_module.get_edges_data(projections, stat_type='PTS')
+            self.assertEqual(compute.call_count, 1)
+            app_module.get_edges_data(projections, stat_type='REB')
+            self.assertEqual(compute.call_count, 2)
+            # Spelling out a default hits the same entry as omitting it
+            app_module.get_edges_data(projections)
+            app_module.get_edges_data(projections, show_only_70_plus=True, sort_by='ev')
+            self.assertEqual(compute.call_count, 2)
+        app_module.clear_edges_cache()
+
+    def test_edges_cache_follows_projections_version(self):
+        """Test the edges cache is keyed on the projections version, not the dict"""
+        import app as app_module
+        result = ([], [], [], {}, None)
+        app_module.clear_edges_cache()
+        with patch.object(app_module, '_compute_edges_data', return_value=result) as compute:
+            app_module.get_edges_data({'Player1': 20.5})
+            # An equal copy (e.g. the file reload after a flush) reuses the entry
+            app_module.get_edges_data({'Player1': 20.5})
+            self.assertEqual(compute.call_count, 1)
+            with app_module._PROJ_LOCK:
+                app_module._bump_projections_version()
+            app_module.get_edges_data({'Player1': 20.5})
+            self.assertEqual(compute.call_count, 2)
+        app_module.clear_edges_cache()
+
+    def test_scheduler_lock_is_exclusive(self):
+        """Test only one holder can take the scheduler lock"""
+        import tempfile
+        import app as app_module
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'scheduler.lock')
+            first = app_module.acquire_scheduler_lock(path)
+            if first is True:
+                self.skipTest("File locks not supported on this platform")
+            try:
+                self.assertIsNotNone(first)
+                self.assertIsNone(app_module.acquire_scheduler_lock(path))
+            finally:
+                first.close()
+            second = app_module.acquire_scheduler_lock(path)
+            self.assertIsNotNone(second)
+            second.close()
+
+    def test_edges_filters_parsed_once_per_query(self):
+        """Test /api/edges query parameters are parsed and cached per query string"""
+        import app as app_module
+        filters = app_module._edges_filters(b'min_probability=60&positive_ev_only=TRUE&min_ev=1.5')
+        self.assertFalse(filters['show_only_70_plus'])
+        self.assertTrue(filters['positive_ev_only'])
+        self.assertEqual(filters['min_ev'], 1.5)
+        self.assertEqual(filters['stat_type'], 'PTS')
+        self.assertIs(app_module._edges_filters(b'min_probability=60&positive_ev_only=TRUE&min_ev=1.5'), filters)
+        self.assertTrue(app_module._edges_filters(b'')['show_only_70_plus'])
+
+    def test_unknown_route_returns_404(self):
+        """Test HTTP errors pass through the global exception handler unchanged"""
+        response = self.client.get('/no-such-page', headers=self.get_auth_headers())
+        self.assertEqual(response.status_code, 404)
+
+    def test_log_error_queues_report_and_drops_overflow(self):
+        """Test error reports are queued with their traceback and bounded"""
+        import queue
+        import app as app_module
+        with patch.object(app_module, '_error_log', queue.Queue(maxsize=1)) as error_log:
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                app_module.log_error("first")
+                app_module.log_error("second")
+            report = error_log.get_nowait()
+            self.assertTrue(error_log.empty())
+        self.assertIn("first", report)
+        self.assertIn("ValueError: boom", report)
+
     def test_api_loading_status(self):
         """Test /api/loading-status endpoint"""
         response = self.client.get('/api/loading-status', headers=self.get_auth_headers())
@@ -284,6 +758,17 @@ class TestGlitchedProps(unittest.TestCase):
         props = get_glitched_props()
         self.assertIsInstance(props, list)
     
+    def test_save_glitched_props_replaces_file(self):
+        """Test glitched props are written via a temp file that is swapped in"""
+        import tempfile
+        import glitched_props
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'glitched_props.json')
+            with patch.object(glitched_props, 'GLITCHED_PROPS_FILE', path):
+                self.assertTrue(glitched_props.save_glitched_props([{'id': 1}]))
+                self.assertEqual(glitched_props.load_glitched_props(), [{'id': 1}])
+            self.assertEqual(os.listdir(tmp_dir), ['glitched_props.json'])
+    
     def test_validate_glitched_prop(self):
         """Test glitched prop validation"""
         from glitched_props import validate_glitched_prop
@@ -299,6 +784,30 @@ class TestGlitchedProps(unittest.TestCase):
         }
         result = validate_glitched_prop(valid_prop)
         self.assertIn('warnings', result)
+    
+    def test_scan_fetches_players_concurrently(self):
+        """Test the scanner records every due player once, skipping recent scans"""
+        import glitched_props_scanner as scanner
+        players = [{'player': {}, 'player_name': name, 'reasons': ['test']} for name in ('A', 'B', 'C')]
+        recent = {'B_PTS': {'last_scan': scanner.datetime.now().isoformat()}}
+        saved = {}
+        with patch.object(scanner, 'get_relevant_players_for_today', return_value=players), \
+                patch.object(scanner, 'load_recent_scans', return_value=recent), \
+                patch.object(scanner, 'save_recent_scans', side_effect=saved.update), \
+                patch.object(scanner, 'compare_lines_across_platforms', return_value=None) as compare:
+            found = scanner.scan_active_players_for_glitches(max_workers=4)
+        self.assertEqual(found, [])
+        self.assertEqual(sorted(call.args[0] for call in compare.call_args_list), ['A', 'C'])
+        self.assertEqual(set(saved), {'A_PTS', 'B_PTS', 'C_PTS'})
+        self.assertFalse(saved['A_PTS']['found_glitch'])
+    
+    def test_platform_fetches_are_throttled(self):
+        """Test every platform fetch goes through the shared API throttle"""
+        import nba_engine
+        import glitched_props_scanner as scanner
+        with patch.object(nba_engine, 'throttled_call', side_effect=lambda fn, *a, **kw: fn(*a, **kw)) as throttled:
+            scanner.compare_lines_across_platforms('Test Player', 'PTS')
+        self.assertEqual(throttled.call_count, len(scanner.PLATFORMS))
 
 
 class TestBetTracker(unittest.TestCase):
@@ -324,6 +833,53 @@ class TestBetTracker(unittest.TestCase):
         
         roi = calculate_roi([])
         self.assertIsInstance(roi, dict)
+    
+    def test_bet_log_appends_patches_and_compacts(self):
+        """Test bets are appended, settled via patch lines and compacted"""
+        import tempfile
+        import bet_tracker
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bets_file = os.path.join(tmp_dir, 'bets.jsonl')
+            with patch.object(bet_tracker, 'BETS_FILE', bets_file), \
+                    patch.object(bet_tracker, 'LEGACY_BETS_FILE', os.path.join(tmp_dir, 'bets.json')), \
+                    patch.object(bet_tracker, 'COMPACT_PATCH_THRESHOLD', 3):
+                first = bet_tracker.add_bet('A', 'PTS', 20.5, 'OVER', -110, 10)
+                second = bet_tracker.add_bet('B', 'PTS', 10.5, 'UNDER', 120, 5)
+                bet_tracker.settle_bet(first['id'], 25)
+                with open(bets_file) as f:
+                    self.assertEqual(len(f.readlines()), 3)
+                
+                bets = {b['id']: b for b in bet_tracker.get_all_bets()}
+                self.assertEqual(bets[first['id']]['result'], 'WIN')
+                self.assertIsNone(bets[second['id']]['result'])
+                
+                # Third patch hits the threshold - the log is rewritten
+                bet_tracker.update_closing_odds(second['id'], 110)
+                self.assertTrue(bet_tracker.delete_bet(first['id']))
+                with open(bets_file) as f:
+                    self.assertEqual(len(f.readlines()), 1)
+                bets = bet_tracker.get_all_bets()
+                self.assertEqual([b['id'] for b in bets], [second['id']])
+                self.assertEqual(bets[0]['odds_closing'], 110)
+    
+    def test_bet_log_skips_malformed_records(self):
+        """Test one bad record in the bets log doesn't hide the others"""
+        import tempfile
+        import bet_tracker
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bets_file = os.path.join(tmp_dir, 'bets.jsonl')
+            with patch.object(bet_tracker, 'BETS_FILE', bets_file), \
+                    patch.object(bet_tracker, 'LEGACY_BETS_FILE', os.path.join(tmp_dir, 'bets.json')):
+                bet = bet_tracker.add_bet('A', 'PTS', 20.5, 'OVER', -110, 10)
+                with open(bets_file, 'a') as f:
+                    f.write('[1, 2]\n{"player": "no id"}\n{"op": "update", "id": "x", "fields": 3}\n')
+                self.assertEqual([b['id'] for b in bet_tracker.load_bets()], [bet['id']])
+                
+                # A failed write reports the update as not applied
+                with patch.object(bet_tracker, '_append', return_value=False):
+                    self.assertIsNone(bet_tracker.settle_bet(bet['id'], 25))
+                    self.assertIsNone(bet_tracker.update_closing_odds(bet['id'], -105))
+                self.assertIsNone(bet_tracker.get_all_bets()[0]['result'])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,46 @@
+"""
+Scheduler worker that runs the background jobs outside the web process.
+Runs the daily projections update and the glitched props scan, writing
+projections.json and glitched_props.json for the web process to pick up.
+
+Usage:
+    python worker.py
+
+Run it next to the web service and set APP_ENABLE_SCHEDULER=0 on the web
+service so the jobs don't also run inside the Flask workers.
+"""
+
+import os
+import sys
+
+# Importing app must not start the in-process scheduler - this process owns it
+os.environ['APP_ENABLE_SCHEDULER'] = '0'
+
+from app import SCHEDULER_LOCK_FILE, acquire_scheduler_lock, register_scheduled_jobs
+
+def main():
+    try:
+        from apscheduler.schedulers.blocking import BlockingScheduler
+    except ImportError:
+        print("ERROR: APScheduler not available - install it to run the worker", file=sys.stderr)
+        sys.exit(1)
+
+    # Same lock the web process takes, so the jobs never run twice on a host
+    scheduler_lock = acquire_scheduler_lock(SCHEDULER_LOCK_FILE)
+    if scheduler_lock is None:
+        print(f"ERROR: Another process is already running the scheduler ({SCHEDULER_LOCK_FILE})", file=sys.stderr)
+        sys.exit(1)
+
+    worker_scheduler = BlockingScheduler()
+    register_scheduled_jobs(worker_scheduler)
+
+    print("Worker scheduler starting")
+    print("   - Daily update: 8:00 AM")
+    print("   - Glitched props scan: Every 5 minutes (24/7)")
+    try:
+        worker_scheduler.start()
+    except (KeyboardInterrupt, SystemExit):
+        print("Worker scheduler stopped")
+
+if __name__ == "__main__":
+    main()